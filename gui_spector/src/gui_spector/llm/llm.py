@@ -1,9 +1,11 @@
-from typing import Optional, Text, Dict, Any, Tuple
+import base64
+from typing import List, Optional, Text, Dict, Any, Tuple
 
 from langchain_anthropic import ChatAnthropic
 from langchain_openai import ChatOpenAI
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import HumanMessage
 
 
 class LLM:
@@ -33,8 +35,19 @@ class LLM:
         self.client = LLM.get_llm_client(model_name=model_name, temperature=temperature,
                                          max_tokens=max_tokens, max_retries=max_retries, timeout=timeout, api_key=api_key)
 
-    def invoke(self, prompt) -> Tuple[Text, Dict[str, Any]]:
+    def invoke(self, prompt, images: Optional[List[bytes]] = None) -> Tuple[Text, Dict[str, Any]]:
         #print(f"Invoking {self.model_name} with prompt: {prompt}")
+        if images:
+            # Send images as dedicated message parts instead of inlining data
+            # URLs into the prompt text; keeps the text prompt small and
+            # provider-cacheable
+            content: List[Dict[str, Any]] = [{"type": "text", "text": prompt}]
+            for img in images:
+                b64 = base64.b64encode(img).decode("utf-8")
+                content.append(
+                    {"type": "image_url", "image_url": {"url": f"data:image/png;base64,{b64}"}}
+                )
+            prompt = [HumanMessage(content=content)]
         if self.model_name == LLM.MODEL_CLAUDE_SONNET_4:
             # Claude Sonnet 4 responses have a special format that does not conform
             # to the other model formats, therefore this custom accessing is required
@@ -19,7 +19,7 @@ class VerificationStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class VerficationRunResult:
     requirement: Requirements
     requirement_id: UUID
@@ -37,7 +37,8 @@ class VerficationRunResult:
     usage_total: Optional[Usage] = None
 
     def __repr__(self) -> str:
-        status_value = self.status.name if hasattr(self.status, "name") else str(self.status)
+        # status is always a VerificationStatus enum; no hasattr guard needed
+        status_value = self.status.name
         return (
             f"VerficationRunResult(requirement_id={self.requirement_id}, status={status_value}, "
             f"elapsed_s={self.elapsed_s:.2f}, start_url={self.start_url!r}, steps_taken={self.steps_taken}, "
@@ -46,7 +47,7 @@ class VerficationRunResult:
         )
 
     def __str__(self) -> str:
-        status_value = self.status.value if hasattr(self.status, "value") else str(self.status)
+        status_value = self.status.value
         line1 = f"Result: {status_value} in {self.elapsed_s:.2f}s (req={self.requirement_id}, turns={len(self.interactions)})"
         if self.error:
             line2 = f"Error: {self.error}"
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 import base64
+import functools
 import json
+import logging
+import mmap
+import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional, Sequence
@@ -10,12 +14,88 @@ from dotenv import load_dotenv
 
 from gui_spector.llm.llm import LLM
 from gui_spector.models.requirements import Requirements
+from gui_spector.processor.llm_cache import LLMResponseCache
+
+try:  # Optional fast JSON parser; stdlib fallback keeps behavior identical
+    import orjson
+except ImportError:
+    orjson = None
+
+try:  # Optional SIMD-accelerated base64; stdlib fallback keeps behavior identical
+    import pybase64
+    _b64encode = pybase64.b64encode
+except ImportError:
+    _b64encode = base64.b64encode
+
+logger = logging.getLogger(__name__)
+
+# Resolved once at import; Path.resolve() does filesystem syscalls
+_PROMPTS_DIR = Path(__file__).resolve().parents[3] / "resources" / "prompts"
+
+# Mime type by file suffix for data-URL prefixes (default: image/png)
+_SUFFIX_TO_MIME = {".jpg": "image/jpeg", ".jpeg": "image/jpeg", ".webp": "image/webp"}
+
+# Reused decoder; raw_decode parses from an offset and stops at the matching
+# close, so no rfind boundary scan is needed
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _parse_json_payload(raw: str, opener: str):
+    """Parse the first JSON value starting at `opener` ("{" or "[") in `raw`.
+
+    Pure-JSON outputs (the common case) go through the fast `_loads` path;
+    outputs with surrounding prose fall back to a single raw_decode pass that
+    correctly handles braces inside quoted strings. Returns None on failure.
+    """
+    start = raw.find(opener)
+    if start == -1:
+        return None
+    if start == 0:
+        try:
+            return _loads(raw)
+        except ValueError:
+            pass
+    try:
+        obj, _ = _JSON_DECODER.raw_decode(raw, start)
+        return obj
+    except ValueError:
+        return None
+
+
+# {{PLACEHOLDER}} matcher for single-pass template substitution
+_PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+
+
+def _render_template(template: str, mapping: dict) -> str:
+    """Substitute all {{NAME}} placeholders in one pass over the template.
+
+    Unlike chained str.replace, this builds the rendered string once instead
+    of allocating a full template copy per placeholder.
+    """
+    return _PLACEHOLDER_RE.sub(lambda m: mapping.get(m.group(1), m.group(0)), template)
 
 
 load_dotenv()
 
 
-@dataclass
+def _loads(json_str: str):
+    """Parse JSON with orjson when available (2-5x faster), else stdlib json.
+
+    Raises ValueError on invalid input for both backends
+    (orjson.JSONDecodeError and json.JSONDecodeError subclass ValueError).
+    """
+    if orjson is not None:
+        return orjson.loads(json_str.encode("utf-8"))
+    return json.loads(json_str)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_template_cached(path_str: str) -> str:
+    """Read and decode a prompt template once; subsequent calls hit the cache."""
+    return Path(path_str).read_text(encoding="utf-8")
+
+
+@dataclass(slots=True)
 class AppExtractionResult:
     description: str
     tags: List[str]
@@ -39,21 +119,22 @@ class AppExtractor:
         llm: Optional[LLM] = None,
         prompt_template_name: Optional[str] = None,
         temperature: float = 0.05,
+        response_cache: Optional[LLMResponseCache] = None,
     ) -> None:
         self.llm = llm or LLM(model_name=LLM.MODEL_GPT_4_1, temperature=temperature)
         self.prompt_template_name = (
             prompt_template_name or self.PROMPT_TEMPLATE_APP_V1
         )
+        self.response_cache = response_cache or LLMResponseCache()
 
     def _load_template(self) -> str:
-        package_root = Path(__file__).resolve().parents[3]  # .../gui_spector
         template_name = self.prompt_template_name
         if not template_name.endswith(".txt"):
             template_name = f"{template_name}.txt"
-        template_path = package_root / "resources" / "prompts" / template_name
+        template_path = _PROMPTS_DIR / template_name
         if not template_path.exists():
             raise FileNotFoundError(f"Prompt template not found: {template_path}")
-        return template_path.read_text(encoding="utf-8")
+        return _load_template_cached(str(template_path))
 
     def _render_prompt(
         self,
@@ -63,30 +144,30 @@ class AppExtractor:
         requirements_text: Optional[str] = None,
     ) -> str:
         template = self._load_template()
-        req_block = "None"
-        if requirements:
-            lines: List[str] = []
-            for r in requirements:
+        if not requirements:
+            # Fast path for pure-screenshot extraction: no list building at all
+            stripped = requirements_text.strip() if requirements_text else ""
+            req_block = stripped or "None"
+        else:
+
+            def _fmt(r: Requirements) -> Optional[str]:
                 title = (r.title or "").strip()
                 desc = (r.description or "").strip()
-                combined = title if title else desc
                 if title and desc and title.lower() not in desc.lower():
-                    combined = f"{title}: {desc}"
-                elif not combined:
-                    continue
-                lines.append(f"- {combined}")
-            if lines:
-                req_block = "\n".join(lines)
-        elif requirements_text and requirements_text.strip():
-            req_block = requirements_text.strip()
-
-        rendered = (
-            template
-            .replace("{{REQUIREMENTS_BLOCK}}", req_block)
-            .replace("{{IMAGE_REFERENCE}}", image_hint or "")
-            .replace("{{MAX_TAGS}}", str(max_tags))
+                    return f"- {title}: {desc}"
+                combined = title or desc
+                return f"- {combined}" if combined else None
+
+            req_block = "\n".join(filter(None, map(_fmt, requirements))) or "None"
+
+        return _render_template(
+            template,
+            {
+                "REQUIREMENTS_BLOCK": req_block,
+                "IMAGE_REFERENCE": image_hint or "",
+                "MAX_TAGS": str(max_tags),
+            },
         )
-        return rendered
 
     def _image_to_data_url(
         self,
@@ -95,16 +176,18 @@ class AppExtractor:
         mime_type: str = "image/png",
     ) -> Optional[str]:
         if image_bytes:
-            b64 = base64.b64encode(image_bytes).decode("utf-8")
+            b64 = _b64encode(image_bytes).decode("utf-8")
             return f"data:{mime_type};base64,{b64}"
         if image_path:
             try:
                 p = Path(image_path)
                 if p.exists():
-                    data = p.read_bytes()
-                    b64 = base64.b64encode(data).decode("utf-8")
-                    suffix = p.suffix.lower()
-                    mt = "image/jpeg" if suffix in [".jpg", ".jpeg"] else ("image/webp" if suffix == ".webp" else "image/png")
+                    # mmap the file so the encoder reads straight from the page
+                    # cache instead of an intermediate read_bytes() copy
+                    with p.open("rb") as fh:
+                        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                            b64 = _b64encode(mapped).decode("utf-8")
+                    mt = _SUFFIX_TO_MIME.get(p.suffix.lower(), "image/png")
                     return f"data:{mt};base64,{b64}"
             except Exception:
                 return None
@@ -120,32 +203,41 @@ class AppExtractor:
         requirements_text: Optional[str] = None,
         max_tags: int = 7,
     ) -> AppExtractionResult:
-        image_ref = image_url or self._image_to_data_url(image_bytes=image_bytes, image_path=image_path)
+        # Prefer sending image bytes as dedicated message parts over inlining a
+        # base64 data URL into the prompt text (keeps the text prompt cacheable)
+        images: Optional[List[bytes]] = None
+        image_ref = image_url
+        if not image_ref:
+            data = image_bytes
+            if data is None and image_path:
+                try:
+                    p = Path(image_path)
+                    if p.exists():
+                        data = p.read_bytes()
+                except Exception:
+                    data = None
+            if data:
+                images = [data]
+                image_ref = "(image attached)"
         prompt_text = self._render_prompt(
             requirements=requirements,
             image_hint=image_ref,
             max_tags=max_tags,
             requirements_text=requirements_text,
         )
-        print(f"Prompt text: {prompt_text}")
-        output, _usage = self.llm.invoke(prompt_text)
-        print(f"Output: {output}")
+        logger.debug("Prompt text: %s", prompt_text)
+        output, _usage = self.response_cache.invoke_cached(self.llm, prompt_text, images=images)
+        logger.debug("Output: %s", output)
 
         raw = (output or "").strip()
         # Try to locate a JSON object
-        start = raw.find("{")
-        end = raw.rfind("}")
-        json_str = raw[start : end + 1] if start != -1 and end != -1 and end > start else raw
-        try:
-            data = json.loads(json_str)
-        except Exception:
+        data = _parse_json_payload(raw, "{")
+        if data is None:
             # Fallback: try pure array -> tags only
-            try:
-                arr = json.loads(json_str)
-                if isinstance(arr, list):
-                    return AppExtractionResult(description="", tags=[str(x).strip() for x in arr if str(x).strip()])
-            except Exception:
-                return AppExtractionResult(description="", tags=[])
+            arr = _parse_json_payload(raw, "[")
+            if isinstance(arr, list):
+                return AppExtractionResult(description="", tags=[str(x).strip() for x in arr if str(x).strip()])
+            return AppExtractionResult(description="", tags=[])
 
         description = ""
         tags: List[str] = []
@@ -163,14 +255,11 @@ class AppExtractor:
                             tags.append(s)
                     break
 
-        # De-duplicate tags while preserving order
-        seen = set()
-        uniq: List[str] = []
+        # De-duplicate tags while preserving order (keys are case-folded once;
+        # dict insertion order keeps the first spelling seen)
+        seen: dict = {}
         for t in tags:
-            t_norm = t.lower().strip()
-            if t_norm and t_norm not in seen:
-                seen.add(t_norm)
-                uniq.append(t)
-        return AppExtractionResult(description=description, tags=uniq)
+            seen.setdefault(t.casefold(), t)
+        return AppExtractionResult(description=description, tags=list(seen.values()))
 
 
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+class LLMResponseCache:
+    """Persistent exact-match cache for LLM responses keyed by prompt hash.
+
+    Entries are stored as one small JSON file per key under `cache_dir`, so the
+    cache survives process restarts and needs no extra dependencies. A cache hit
+    turns a multi-hundred-ms LLM round-trip into a sub-ms disk lookup.
+    """
+
+    DEFAULT_CACHE_DIR = ".gui_spector_cache"
+
+    def __init__(self, cache_dir: Optional[str] = None) -> None:
+        self.cache_dir = Path(cache_dir or self.DEFAULT_CACHE_DIR)
+
+    @staticmethod
+    def key_for(
+        prompt: str,
+        images: Optional[Sequence[bytes]] = None,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+    ) -> str:
+        # The model identity is part of the key: the same prompt run under
+        # different models (or temperatures) must not share cached output
+        digest = hashlib.blake2b(f"{model}\x00{temperature}\x00".encode("utf-8"), digest_size=16)
+        digest.update(prompt.encode("utf-8"))
+        for img in images or ():
+            digest.update(img)
+        return digest.hexdigest()
+
+    def _path_for(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        path = self._path_for(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            return entry["output"], entry.get("usage") or {}
+        except Exception:
+            return None
+
+    def set(self, key: str, output: str, usage: Optional[Dict[str, Any]]) -> None:
+        try:
+            self.cache_dir.mkdir(exist_ok=True, parents=True)
+            payload = json.dumps({"output": output, "usage": usage or {}}, ensure_ascii=False)
+            self._path_for(key).write_text(payload, encoding="utf-8")
+        except Exception:
+            # Caching is best-effort; never fail the LLM call because of it
+            pass
+
+    def invoke_cached(
+        self, llm, prompt: str, images: Optional[List[bytes]] = None
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Return a cached (output, usage) for `prompt` or invoke `llm` and store it."""
+        key = self.key_for(
+            prompt,
+            images,
+            model=getattr(llm, "model_name", None),
+            temperature=getattr(llm, "temperature", None),
+        )
+        hit = self.get(key)
+        if hit is not None:
+            return hit
+        output, usage = llm.invoke(prompt, images=images) if images else llm.invoke(prompt)
+        self.set(key, output, usage)
+        return output, usage
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+from gui_spector.models.requirements import Requirements, RequirementsPriority
+from gui_spector.processor.app_extractor import AppExtractor, AppExtractionResult
+from gui_spector.processor.requirements_processor import RequirementsProcessor
+
+
+def extract_app_and_requirements(
+    app_extractor: AppExtractor,
+    requirements_processor: RequirementsProcessor,
+    *,
+    input_text: str,
+    image_bytes: Optional[bytes] = None,
+    image_path: Optional[str] = None,
+    image_url: Optional[str] = None,
+    max_tags: int = 7,
+    allow_guess: bool = True,
+    default_priority: RequirementsPriority = RequirementsPriority.MEDIUM,
+    source: Optional[str] = None,
+) -> Tuple[AppExtractionResult, List[Requirements]]:
+    """Run app extraction and requirements extraction concurrently.
+
+    Both calls are independent LLM round-trips (network-bound, so the GIL is
+    not a bottleneck); firing them on a two-worker thread pool brings wall
+    time for the pair down to max(t1, t2) instead of t1 + t2.
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        app_future = executor.submit(
+            app_extractor.extract_app,
+            image_bytes=image_bytes,
+            image_path=image_path,
+            image_url=image_url,
+            requirements=None,
+            requirements_text=input_text,
+            max_tags=max_tags,
+        )
+        req_future = executor.submit(
+            requirements_processor.process_text,
+            input_text=input_text,
+            allow_guess=allow_guess,
+            default_priority=default_priority,
+            source=source,
+        )
+        return app_future.result(), req_future.result()
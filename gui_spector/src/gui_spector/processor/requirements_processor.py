@@ -1,15 +1,86 @@
 from __future__ import annotations
 
+import functools
 import json
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional, Sequence
 from dotenv import load_dotenv
 from gui_spector.llm.llm import LLM
 from gui_spector.models.requirements import Requirements, RequirementsPriority
 from gui_spector.models.acceptance_criterion import AcceptanceCriterion, AcceptanceState
+from gui_spector.processor.llm_cache import LLMResponseCache
+
+try:  # Optional fast JSON parser; stdlib fallback keeps behavior identical
+    import orjson
+except ImportError:
+    orjson = None
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Resolved once at import; Path.resolve() does filesystem syscalls
+_PROMPTS_DIR = Path(__file__).resolve().parents[3] / "resources" / "prompts"
+
+# Reused decoder; raw_decode parses from an offset and stops at the matching
+# close, so no rfind boundary scan is needed
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _parse_json_payload(raw: str, opener: str):
+    """Parse the first JSON value starting at `opener` ("{" or "[") in `raw`.
+
+    Pure-JSON outputs (the common case) go through the fast `_loads` path;
+    outputs with surrounding prose fall back to a single raw_decode pass that
+    correctly handles brackets inside quoted strings. Returns None on failure.
+    """
+    start = raw.find(opener)
+    if start == -1:
+        return None
+    if start == 0:
+        try:
+            return _loads(raw)
+        except ValueError:
+            pass
+    try:
+        obj, _ = _JSON_DECODER.raw_decode(raw, start)
+        return obj
+    except ValueError:
+        return None
+
+
+# {{PLACEHOLDER}} matcher for single-pass template substitution
+_PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+
+
+def _render_template(template: str, mapping: dict) -> str:
+    """Substitute all {{NAME}} placeholders in one pass over the template.
+
+    Unlike chained str.replace, this builds the rendered string once instead
+    of allocating a full template copy per placeholder.
+    """
+    return _PLACEHOLDER_RE.sub(lambda m: mapping.get(m.group(1), m.group(0)), template)
+
+
+def _loads(json_str: str):
+    """Parse JSON with orjson when available (2-5x faster), else stdlib json.
+
+    Raises ValueError on invalid input for both backends
+    (orjson.JSONDecodeError and json.JSONDecodeError subclass ValueError).
+    """
+    if orjson is not None:
+        return orjson.loads(json_str.encode("utf-8"))
+    return json.loads(json_str)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_template_cached(path_str: str) -> str:
+    """Read and decode a prompt template once; subsequent calls hit the cache."""
+    return Path(path_str).read_text(encoding="utf-8")
+
 
 class RequirementsProcessor:
     """Processes plain text into a list of `Requirements` using an LLM.
@@ -26,21 +97,22 @@ class RequirementsProcessor:
         llm: Optional[LLM] = None,
         prompt_template_name: Optional[str] = None,
         temperature: float = 0.05,
+        response_cache: Optional[LLMResponseCache] = None,
     ) -> None:
         self.llm = llm or LLM(model_name=LLM.MODEL_GPT_4_1, temperature=temperature)
         self.prompt_template_name = (
             prompt_template_name or self.PROMPT_TEMPLATE_EXTRACTION_V1
         )
+        self.response_cache = response_cache or LLMResponseCache()
 
     def _load_template(self) -> str:
-        package_root = Path(__file__).resolve().parents[3]  # .../gui_spector
         template_name = self.prompt_template_name
         if not template_name.endswith(".txt"):
             template_name = f"{template_name}.txt"
-        template_path = package_root / "resources" / "prompts" / template_name
+        template_path = _PROMPTS_DIR / template_name
         if not template_path.exists():
             raise FileNotFoundError(f"Prompt template not found: {template_path}")
-        return template_path.read_text(encoding="utf-8")
+        return _load_template_cached(str(template_path))
 
     def _render_prompt(
         self,
@@ -52,13 +124,14 @@ class RequirementsProcessor:
         template = self._load_template()
         # If a source is provided, prepend it to the input section so the model can use it.
         final_input = f"Source: {source}\n\n{input_text}" if source else input_text
-        rendered = (
-            template
-            .replace("{{INPUT_TEXT}}", final_input)
-            .replace("{{ALLOW_GUESS}}", "true" if allow_guess else "false")
-            .replace("{{DEFAULT_PRIORITY}}", default_priority.value)
+        return _render_template(
+            template,
+            {
+                "INPUT_TEXT": final_input,
+                "ALLOW_GUESS": "true" if allow_guess else "false",
+                "DEFAULT_PRIORITY": default_priority.value,
+            },
         )
-        return rendered
 
     def _parse_priority(self, value: Optional[str]) -> RequirementsPriority:
         if not value:
@@ -74,26 +147,20 @@ class RequirementsProcessor:
             return []
         if isinstance(maybe_list, str):
             # Split by common delimiters if it looks like a CSV string
-            parts = [p.strip() for p in maybe_list.replace(";", ",").split(",")]
-            return [p for p in parts if p]
+            return [p for p in (s.strip() for s in maybe_list.replace(";", ",").split(",")) if p]
         if isinstance(maybe_list, Sequence):
-            return [str(x) for x in maybe_list if str(x).strip()]
+            return [s for s in (str(x).strip() for x in maybe_list) if s]
         return []
 
     def _coerce_criteria_list(self, maybe_list: Optional[Sequence[str]]) -> List[AcceptanceCriterion]:
         """Assume a list of strings and generate AC-1, AC-2, ... names in order."""
         if not maybe_list:
             return []
-        result: List[AcceptanceCriterion] = []
-        index = 1
-        for it in list(maybe_list):
-            text = str(it).strip()
-            if not text:
-                index += 1
-                continue
-            result.append(AcceptanceCriterion.create(name=f"AC-{index}", text=text, state=AcceptanceState.UNPROCESSED))
-            index += 1
-        return result
+        return [
+            AcceptanceCriterion.create(name=f"AC-{index}", text=text, state=AcceptanceState.UNPROCESSED)
+            for index, text in enumerate((str(it).strip() for it in maybe_list), start=1)
+            if text
+        ]
 
     def process_text(
         self,
@@ -110,20 +177,13 @@ class RequirementsProcessor:
             default_priority=default_priority,
             source=source,
         )
-        print(f"Prompt: {prompt}")
-        output, _usage = self.llm.invoke(prompt)
-        print(f"Output: {output}")
+        logger.debug("Prompt: %s", prompt)
+        output, _usage = self.response_cache.invoke_cached(self.llm, prompt)
+        logger.debug("Output: %s", output)
         # Attempt to locate a JSON array in the output (robustness if model adds stray text)
         raw = output.strip()
-        json_str = raw
-        start = raw.find("[")
-        end = raw.rfind("]")
-        if start != -1 and end != -1 and end > start:
-            json_str = raw[start : end + 1]
-
-        try:
-            data = json.loads(json_str)
-        except json.JSONDecodeError:
+        data = _parse_json_payload(raw, "[")
+        if data is None:
             raise ValueError("LLM did not return valid JSON array of requirements.")
 
         if not isinstance(data, list):
@@ -157,4 +217,34 @@ class RequirementsProcessor:
 
         return requirements
 
+    def process_texts(
+        self,
+        input_texts: Sequence[str],
+        allow_guess: bool = True,
+        default_priority: RequirementsPriority = RequirementsPriority.MEDIUM,
+        source: Optional[str] = None,
+        max_workers: int = 4,
+    ) -> List[List[Requirements]]:
+        """Extract requirements from several texts with one parallel dispatch.
+
+        The per-text LLM round-trips are network-bound, so they are issued
+        concurrently via a thread pool; wall time approaches a single
+        round-trip instead of one per text. Results are returned in input
+        order, one requirement list per text.
+        """
+        if not input_texts:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(input_texts))) as executor:
+            futures = [
+                executor.submit(
+                    self.process_text,
+                    input_text=text,
+                    allow_guess=allow_guess,
+                    default_priority=default_priority,
+                    source=source,
+                )
+                for text in input_texts
+            ]
+            return [f.result() for f in futures]
+
 
@@ -686,8 +686,23 @@ class VerficationRunner:
         debug: bool = False,
         progress_callback: Optional[Callable[[dict], None]] = None,
     ) -> List[VerficationRunResult]:
+        """Run verification for every requirement sequentially; results keep
+        input order.
+
+        Runs cannot overlap on one runner: run() resets the per-run
+        accumulators (self._usages, self._response_extras, ...) and drives
+        the single shared self.computer browser session, so concurrent
+        runs would cross-contaminate results and tear down each other's
+        browser. Callers wanting parallelism must use one runner (and one
+        computer) per worker, as the Celery tasks do.
+
+        Cancellation contract: after each completed run the callback is
+        invoked with {"event": "run_done", ...}; returning False from it
+        stops the batch before the next run starts, so abandoned batches
+        do not keep burning model cost.
+        """
         results: List[VerficationRunResult] = []
-        for req in requirements:
+        for idx, req in enumerate(requirements):
             results.append(
                 self.run(
                     requirement=req,
@@ -698,4 +713,18 @@ class VerficationRunner:
                     progress_callback=progress_callback,
                 )
             )
+            if callable(progress_callback):
+                try:
+                    cb_ret = progress_callback(
+                        {
+                            "event": "run_done",
+                            "idx": idx,
+                            "total": len(requirements),
+                        }
+                    )
+                except Exception:
+                    cb_ret = None
+                if cb_ret is False:
+                    print(f"Batch cancelled by progress callback after run {idx + 1}/{len(requirements)}")
+                    break
         return results
@@ -9,53 +9,85 @@ from __future__ import annotations
 
 import argparse
 import os
+import shutil
 import sys
-import time
+import tempfile
 from pathlib import Path
 
+# Bounded copy buffer for the rewrite path; keeps peak RSS flat regardless
+# of file size instead of materializing the whole file as a bytes object.
+_COPY_BUFFER_SIZE = 1024 * 1024
 
-def refresh_file(path_str: str) -> None:
+
+def _rewrite_file(file_path: Path) -> None:
+    """Rewrite a file's bytes via a sibling temp file and atomic replace."""
+    with tempfile.NamedTemporaryFile(dir=file_path.parent, delete=False) as tmp:
+        tmp_name = tmp.name
+        try:
+            with open(file_path, "rb") as src:
+                shutil.copyfileobj(src, tmp, _COPY_BUFFER_SIZE)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+            # NamedTemporaryFile is created 0600; carry the original mode
+            # over so the swap does not chmod the watched file (which could
+            # make it unreadable to the service watching it)
+            os.chmod(tmp.fileno(), os.stat(file_path).st_mode)
+        except Exception:
+            os.unlink(tmp_name)
+            raise
+    os.replace(tmp_name, file_path)
+
+
+def refresh_file(path_str: str, rewrite: bool = False) -> None:
     file_path = Path(path_str)
     if not file_path.exists():
         raise FileNotFoundError(f"Path does not exist: {file_path}")
     if file_path.is_dir():
         raise IsADirectoryError(f"Expected a file, got directory: {file_path}")
 
-    # Read and write the same bytes to emit a write event on some watchers
-    data: bytes
-    with file_path.open("rb") as rf:
-        data = rf.read()
-    with file_path.open("r+b") as wf:
-        wf.seek(0)
-        wf.write(data)
-        wf.truncate()
-        try:
-            wf.flush()
-            os.fsync(wf.fileno())
-        except Exception:
-            # fsync may not be available/needed on some platforms
-            pass
+    if rewrite:
+        # Some watchers only react to content writes (close_write events);
+        # for those, rewrite through a bounded buffer and replace atomically.
+        _rewrite_file(file_path)
+        return
+
+    # A metadata-only touch is enough to wake modern watchers (inotify
+    # IN_ATTRIB, ReadDirectoryChangesW FILE_NOTIFY_CHANGE_LAST_WRITE):
+    # one utimensat syscall, no bytes read or rewritten, no fsync latency.
+    os.utime(file_path, None)
+
 
-    # Ensure modification time is updated to now
-    try:
-        now = time.time()
-        os.utime(file_path, (now, now))
-    except Exception:
-        pass
+def refresh_files(path_strs: list[str], rewrite: bool = False) -> list[tuple[str, Exception]]:
+    """Refresh many files in one process; returns (path, error) for failures.
+
+    Batching avoids spawning one interpreter per file in watch-bust
+    workflows; each touch itself is a single syscall.
+    """
+    errors: list[tuple[str, Exception]] = []
+    for path_str in path_strs:
+        try:
+            refresh_file(path_str, rewrite=rewrite)
+        except Exception as exc:
+            errors.append((path_str, exc))
+    return errors
 
 
 def main(argv: list[str] | None = None) -> int:
-    parser = argparse.ArgumentParser(description="Re-save a file to trigger watchers")
-    parser.add_argument("file_path", help="Absolute path to the file to refresh")
+    parser = argparse.ArgumentParser(description="Re-save one or more files to trigger watchers")
+    parser.add_argument("file_paths", nargs="+", help="Absolute path(s) to the file(s) to refresh")
+    parser.add_argument(
+        "--rewrite",
+        action="store_true",
+        help="Rewrite file contents (for watchers that ignore metadata-only touches)",
+    )
     args = parser.parse_args(argv)
-    try:
-        refresh_file(args.file_path)
-    except Exception as exc:
-        print(f"ERROR: {exc}", file=sys.stderr)
+    errors = refresh_files(args.file_paths, rewrite=args.rewrite)
+    for path_str, exc in errors:
+        print(f"ERROR: {path_str}: {exc}", file=sys.stderr)
+    if errors:
         return 1
-    else:
-        print("refreshed")
-        return 0
+    print("refreshed")
+    return 0
 
 
 if __name__ == "__main__":
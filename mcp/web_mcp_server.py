@@ -34,11 +34,32 @@ import sys
 import json
 import logging
 import asyncio
+import functools
+import random
+from time import monotonic
 from typing import Any, Dict, List, Optional
 
 import httpx
 from mcp.server.fastmcp import FastMCP
 
+try:  # Optional push-based waiting; HTTP polling remains the fallback
+    import websockets
+except ImportError:
+    websockets = None
+
+try:  # Optional fast JSON parser for response bodies in the poll loop
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _parse_response(resp: httpx.Response) -> Any:
+    """Decode a JSON response body; orjson parses resp.content directly
+    (no intermediate str) and falls back to httpx's stdlib-based .json()."""
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
 
 # Configure stderr logging per MCP guidance (never stdout)
 logging.basicConfig(
@@ -48,8 +69,50 @@ logging.basicConfig(
 )
 
 
+# Resolved once at import; every HTTP call previously re-read the env var and
+# re-stripped the trailing slash
+_BASE_URL = os.environ.get("WEBAPP_BASE_URL", "http://localhost:8000").rstrip("/")
+
+# Pre-built URL template for the hottest endpoint (per-requirement decision)
+_DECISION_URL_TMPL = _BASE_URL + "/requirements/{rid}/api/decision/"
+
+
+@functools.lru_cache(maxsize=1024)
+def _decision_url(requirement_id: int) -> httpx.URL:
+    """Parsed httpx.URL per requirement id, built once; a batch polls the
+    same handful of URLs thousands of times and httpx re-parses plain
+    strings on every request."""
+    return httpx.URL(_DECISION_URL_TMPL.format(rid=requirement_id))
+
+
 def _get_base_url() -> str:
-    return os.environ.get("WEBAPP_BASE_URL", "http://localhost:8000").rstrip("/")
+    return _BASE_URL
+
+
+# One shared client for all tool calls: keep-alive sockets skip the per-request
+# TCP/TLS handshake, and HTTP/2 (when the h2 extra is installed) multiplexes
+# concurrent polls over a single connection.
+_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+async def _client() -> httpx.AsyncClient:
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        limits = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+        timeout = httpx.Timeout(30.0, connect=5.0)
+        try:
+            _CLIENT = httpx.AsyncClient(http2=True, limits=limits, timeout=timeout)
+        except ImportError:
+            # h2 not installed; connection pooling alone is still a win
+            _CLIENT = httpx.AsyncClient(limits=limits, timeout=timeout)
+    return _CLIENT
+
+
+async def _close_client() -> None:
+    global _CLIENT
+    if _CLIENT is not None and not _CLIENT.is_closed:
+        await _CLIENT.aclose()
+    _CLIENT = None
 
 
 async def _http_get(path: str, params: Optional[Dict[str, Any]] = None) -> Any:
@@ -64,11 +127,11 @@ async def _http_get(path: str, params: Optional[Dict[str, Any]] = None) -> Any:
     """
     url = f"{_get_base_url()}{path}"
     logging.debug("HTTP GET %s params=%s", url, params)
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        resp = await client.get(url, params=params)
-        resp.raise_for_status()
-        logging.info("HTTP GET %s -> %s", url, resp.status_code)
-        return resp.json()
+    client = await _client()
+    resp = await client.get(url, params=params)
+    resp.raise_for_status()
+    logging.debug("HTTP GET %s -> %s", url, resp.status_code)
+    return _parse_response(resp)
 
 
 async def _http_post(path: str, json_body: Optional[Dict[str, Any]] = None) -> Any:
@@ -82,12 +145,14 @@ async def _http_post(path: str, json_body: Optional[Dict[str, Any]] = None) -> A
         Parsed JSON response
     """
     url = f"{_get_base_url()}{path}"
-    logging.debug("HTTP POST %s json=%s", url, json.dumps(json_body) if json_body is not None else None)
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        resp = await client.post(url, json=json_body)
-        resp.raise_for_status()
-        logging.info("HTTP POST %s -> %s", url, resp.status_code)
-        return resp.json()
+    # %s-formatting of the dict is deferred until the record is actually
+    # emitted, unlike the eager json.dumps this replaces
+    logging.debug("HTTP POST %s json=%s", url, json_body)
+    client = await _client()
+    resp = await client.post(url, json=json_body)
+    resp.raise_for_status()
+    logging.debug("HTTP POST %s -> %s", url, resp.status_code)
+    return _parse_response(resp)
 
 
 # Internal HTTP helpers (not exposed as MCP tools)
@@ -105,20 +170,130 @@ async def _start_verification_batch_http(setup_id: int, requirement_ids: List[in
     return await _http_post("/requirements/api/verification/start_batch/", json_body=payload)
 
 
-async def _get_latest_decision_http(requirement_id: int) -> Dict[str, Any]:
-    logging.debug("Fetch latest decision requirement_id=%s", requirement_id)
-    return await _http_get(f"/requirements/{int(requirement_id)}/api/decision/")
+async def _get_latest_decision_http(
+    requirement_id: int, wait_seconds: Optional[float] = None
+) -> Dict[str, Any]:
+    logging.debug("Fetch latest decision requirement_id=%s wait=%s", requirement_id, wait_seconds)
+    params = {"wait": wait_seconds} if wait_seconds else None
+    # Hot path: go straight to the pooled client with a cached pre-parsed
+    # URL object instead of re-building and re-parsing a string per poll
+    url = _decision_url(int(requirement_id))
+    client = await _client()
+    resp = await client.get(url, params=params)
+    resp.raise_for_status()
+    return _parse_response(resp)
+
+
+async def _get_decisions_bulk_http(ids: List[int]) -> Dict[str, Any]:
+    """Fetch the latest decisions for several requirements in one request.
+
+    Returns the {"<id>": {status, model_decision_json}} mapping from the
+    backend's bulk endpoint (one SELECT instead of N)."""
+    logging.debug("Fetch latest decisions bulk count=%s", len(ids))
+    data = await _http_get("/requirements/api/decisions/", params={"ids": ",".join(map(str, ids))})
+    return (data or {}).get("decisions") or {}
+
+
+def _get_ws_base_url() -> str:
+    base = _get_base_url()
+    if base.startswith("https://"):
+        return "wss://" + base[len("https://"):]
+    if base.startswith("http://"):
+        return "ws://" + base[len("http://"):]
+    return base
+
+
+async def _await_decision_ws(requirement_id: int, deadline: float) -> Optional[Dict[str, Any]]:
+    """Wait for the run's terminal WebSocket event instead of polling.
+
+    Subscribes to ws/runs/<req_id>/ and blocks until a "finished" event (then
+    fetches the decision once over HTTP) or `deadline` (monotonic-clock based).
+    Returns None when websockets is unavailable or anything fails, so callers
+    can fall back to HTTP polling.
+    """
+    if websockets is None:
+        return None
+    url = f"{_get_ws_base_url()}/ws/runs/{int(requirement_id)}/"
+    try:
+        async with websockets.connect(url) as ws:
+            # Cover runs that finished before we subscribed
+            info = await _get_latest_decision_http(requirement_id=requirement_id)
+            if _is_final(info):
+                return info
+            while True:
+                remaining_s = deadline - monotonic()
+                if remaining_s <= 0:
+                    return None
+                msg = json.loads(await asyncio.wait_for(ws.recv(), timeout=remaining_s))
+                if isinstance(msg, dict) and msg.get("phase") == "finished":
+                    return await _get_latest_decision_http(requirement_id=requirement_id)
+    except Exception as exc:
+        logging.warning("WebSocket wait failed requirement_id=%s: %s", requirement_id, exc)
+        return None
 
 
 mcp = FastMCP("gui-spector-webapi")
 logging.info("Registered MCP server instance: gui-spector-webapi")
 
 # Internal polling configuration (not exposed to tool callers)
-_POLL_INTERVAL_SECONDS_SINGLE = 10.0
-_POLL_INTERVAL_SECONDS_BATCH = 10.0
+# Per-request hanging-GET window; the backend holds the response until a
+# decision exists or this many seconds elapsed (server caps at 30s)
+_LONG_POLL_WAIT_SECONDS = 30.0
 _TIMEOUT_SECONDS_SINGLE = 1000.0
 _TIMEOUT_SECONDS_BATCH = 5000.0
 
+# Requirement statuses the backend never leaves again; errored runs carry no
+# model_decision_json, so waiting for it would idle until the full timeout
+_TERMINAL_STATUSES = {"met", "unmet", "partially_met", "error"}
+
+
+def _is_final(info: Optional[Dict[str, Any]]) -> bool:
+    """True when a decision payload represents a finished run."""
+    if not info:
+        return False
+    return bool(info.get("model_decision_json")) or info.get("status") in _TERMINAL_STATUSES
+
+
+def _build_batch_result(
+    results: Dict[int, Dict[str, Any]], remaining: set, timeout: bool
+) -> Dict[str, Any]:
+    """Assemble the batch tool's return payload from collected decisions."""
+    return {
+        "items": [
+            {
+                "requirement_id": rid,
+                "status": (info or {}).get("status"),
+                "model_decision_json": (info or {}).get("model_decision_json"),
+            }
+            for rid, info in results.items()
+        ],
+        "pending": sorted(remaining),
+        "timeout": timeout,
+    }
+
+
+class _Backoff:
+    """Truncated exponential backoff with +/-20% jitter for poll retries.
+
+    Starts at `min_delay`, multiplies by `factor` on every `next()` up to
+    `max_delay`, and is `reset()` whenever the backend returned useful state,
+    so healthy backends are polled promptly while dead ones are not hammered.
+    """
+
+    def __init__(self, min_delay: float = 0.5, max_delay: float = 30.0, factor: float = 1.5) -> None:
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.factor = factor
+        self.current = min_delay
+
+    def next(self) -> float:
+        delay = self.current * (1.0 + random.uniform(-0.2, 0.2))
+        self.current = min(self.max_delay, self.current * self.factor)
+        return max(0.0, delay)
+
+    def reset(self) -> None:
+        self.current = self.min_delay
+
 
 @mcp.tool()
 async def setups_list() -> Dict[str, Any]:
@@ -197,21 +372,48 @@ async def verification_run_single_sync(setup_id: int, requirement_id: int) -> Di
     Returns:
         Dict with keys: requirement_id, status, model_decision_json
     """
+    # Normalize once; every downstream use can assume a plain int
+    setup_id = int(setup_id)
+    requirement_id = int(requirement_id)
     # Kick off run via HTTP
     logging.info("Sync verify (single) start setup_id=%s requirement_id=%s", setup_id, requirement_id)
     await _start_verification_single_http(setup_id=setup_id, requirement_id=requirement_id)
-    # Poll for decision
-    import time as _time
-    deadline = _time.time() + float(_TIMEOUT_SECONDS_SINGLE)
+    # Long-poll for the decision: the backend hangs each GET until the decision
+    # is written or the wait window elapses, so no fixed-interval sleeping
+    deadline = monotonic() + float(_TIMEOUT_SECONDS_SINGLE)
+    # Prefer push-based completion over the runs WebSocket; fall back to
+    # HTTP long-polling when the socket is unavailable
+    info = await _await_decision_ws(requirement_id=requirement_id, deadline=deadline)
+    if _is_final(info):
+        logging.info("Sync verify (single) done requirement_id=%s status=%s", requirement_id, info.get("status"))
+        return info
+    backoff = _Backoff()
+    info: Optional[Dict[str, Any]] = None
     while True:
-        info = await _get_latest_decision_http(requirement_id=requirement_id)
-        if info and info.get("model_decision_json"):
+        wait = max(0.0, min(_LONG_POLL_WAIT_SECONDS, deadline - monotonic()))
+        try:
+            info = await _get_latest_decision_http(requirement_id=requirement_id, wait_seconds=wait)
+        except httpx.HTTPError as exc:
+            logging.warning("Sync verify (single) poll error requirement_id=%s: %s", requirement_id, exc)
+            # Drop the stale response from the previous cycle: a failing
+            # backend must not keep resetting the backoff below, and the old
+            # fall-through slept a second time per error
+            info = None
+            if monotonic() >= deadline:
+                logging.warning("Sync verify (single) timeout requirement_id=%s", requirement_id)
+                return {"requirement_id": requirement_id, "status": None, "model_decision_json": None}
+            await asyncio.sleep(backoff.next())
+            continue
+        if info:
+            backoff.reset()
+        else:
+            await asyncio.sleep(backoff.next())
+        if _is_final(info):
             logging.info("Sync verify (single) done requirement_id=%s status=%s", requirement_id, info.get("status"))
             return info
-        if _time.time() >= deadline:
+        if monotonic() >= deadline:
             logging.warning("Sync verify (single) timeout requirement_id=%s", requirement_id)
-            return info or {"requirement_id": int(requirement_id), "status": None, "model_decision_json": None}
-        await asyncio.sleep(float(_POLL_INTERVAL_SECONDS_SINGLE))
+            return info or {"requirement_id": requirement_id, "status": None, "model_decision_json": None}
 
 
 @mcp.tool()
@@ -235,65 +437,94 @@ async def verification_run_batch_sync(
         - pending: list of requirement ids that did not finish
         - timeout: boolean flag indicating a timeout occurred
     """
+    # Normalize ids to ints once at entry; the polling loop below touches
+    # each id many times per cycle and can then skip all repeated casts
+    setup_id = int(setup_id)
+    normalized_ids = [int(r) for r in (requirement_ids or [])]
     # Kick off batch via HTTP
-    logging.info("Sync verify (batch) start setup_id=%s count=%s", setup_id, len(requirement_ids or []))
-    await _start_verification_batch_http(setup_id=int(setup_id), requirement_ids=requirement_ids)
+    logging.info("Sync verify (batch) start setup_id=%s count=%s", setup_id, len(normalized_ids))
+    await _start_verification_batch_http(setup_id=setup_id, requirement_ids=normalized_ids)
 
     # Track results by id
-    remaining: set[int] = set(int(r) for r in (requirement_ids or []))
+    remaining: set[int] = set(normalized_ids)
     results: Dict[int, Dict[str, Any]] = {}
 
-    import time as _time
-    deadline = _time.time() + float(_TIMEOUT_SECONDS_BATCH)
+    deadline = monotonic() + float(_TIMEOUT_SECONDS_BATCH)
+
+    # Push-based phase: wait on each run's WebSocket and collect decisions as
+    # they finish; anything that fails drops through to the polling loop
+    if websockets is not None and remaining:
+
+        async def _ws_wait(rid: int):
+            return rid, await _await_decision_ws(requirement_id=rid, deadline=deadline)
+
+        for fut in asyncio.as_completed([_ws_wait(rid) for rid in list(remaining)]):
+            rid, info = await fut
+            if _is_final(info):
+                logging.info("Sync verify (batch) item done requirement_id=%s status=%s", rid, info.get("status"))
+                results[rid] = info
+                remaining.discard(rid)
+
+    backoff = _Backoff()
+    # Cap the per-cycle fan-out so a large batch cannot overwhelm the backend
+    poll_semaphore = asyncio.Semaphore(20)
+
+    async def _poll_one(rid: int) -> Dict[str, Any]:
+        async with poll_semaphore:
+            return await _get_latest_decision_http(requirement_id=rid)
+
     while remaining:
         completed_now: List[int] = []
-        for rid in list(remaining):
-            info = await _get_latest_decision_http(requirement_id=int(rid))
-            # Consider decision complete when model_decision_json is present and status is terminal
-            decision = info.get("model_decision_json") if isinstance(info, dict) else None
-            status = info.get("status") if isinstance(info, dict) else None
-            if decision:
-                results[int(rid)] = info
-                completed_now.append(int(rid))
+        had_error = False
+        rids = list(remaining)
+        try:
+            # One bulk request per cycle (single SELECT server-side) instead
+            # of one request per pending requirement
+            decisions = await _get_decisions_bulk_http(rids)
+            infos: List[Any] = [
+                {
+                    "requirement_id": rid,
+                    "status": entry.get("status"),
+                    "model_decision_json": entry.get("model_decision_json"),
+                }
+                if isinstance(entry := decisions.get(str(rid)), dict)
+                else None
+                for rid in rids
+            ]
+        except httpx.HTTPError as exc:
+            # Older backends without the bulk endpoint: fall back to
+            # concurrent per-requirement polls over the pooled client
+            logging.warning("Bulk decision fetch failed (%s); falling back to per-item polls", exc)
+            infos = await asyncio.gather(*(_poll_one(rid) for rid in rids), return_exceptions=True)
+        for rid, info in zip(rids, infos):
+            if isinstance(info, BaseException):
+                logging.warning("Sync verify (batch) poll error requirement_id=%s: %s", rid, info)
+                had_error = True
+                continue
+            # Complete once a decision exists or the status is terminal; an
+            # errored run never produces model_decision_json
+            if isinstance(info, dict) and _is_final(info):
+                results[rid] = info
+                completed_now.append(rid)
         for rid in completed_now:
-            logging.info("Sync verify (batch) item done requirement_id=%s status=%s", rid, (results.get(int(rid)) or {}).get("status"))
-            remaining.discard(int(rid))
+            logging.info("Sync verify (batch) item done requirement_id=%s status=%s", rid, (results.get(rid) or {}).get("status"))
+            remaining.discard(rid)
+        if completed_now and not had_error:
+            backoff.reset()
         if not remaining:
             break
-        if _time.time() >= deadline:
-            # Gather latest states for remaining and return
-            for rid in list(remaining):
-                info = await _get_latest_decision_http(requirement_id=int(rid))
-                results[int(rid)] = info
-            logging.warning("Sync verify (batch) timeout setup_id=%s pending=%s", setup_id, sorted(int(r) for r in remaining))
-            return {
-                "items": [
-                    {
-                        "requirement_id": k,
-                        "status": (v or {}).get("status"),
-                        "model_decision_json": (v or {}).get("model_decision_json"),
-                    }
-                    for k, v in results.items()
-                ],
-                "pending": sorted(int(r) for r in remaining),
-                "timeout": True,
-            }
-        await asyncio.sleep(float(_POLL_INTERVAL_SECONDS_BATCH))
+        if monotonic() >= deadline:
+            # Gather latest known state, but only for ids without any prior
+            # entry — no extra round-trip per item already in `results`
+            for rid in remaining - results.keys():
+                results[rid] = await _get_latest_decision_http(requirement_id=rid)
+            logging.warning("Sync verify (batch) timeout setup_id=%s pending=%s", setup_id, sorted(remaining))
+            return _build_batch_result(results, remaining, timeout=True)
+        await asyncio.sleep(backoff.next())
 
     # All done
     logging.info("Sync verify (batch) complete setup_id=%s items=%s", setup_id, len(results))
-    return {
-        "items": [
-            {
-                "requirement_id": k,
-                "status": (v or {}).get("status"),
-                "model_decision_json": (v or {}).get("model_decision_json"),
-            }
-            for k, v in results.items()
-        ],
-        "pending": [],
-        "timeout": False,
-    }
+    return _build_batch_result(results, set(), timeout=False)
 
 
 if __name__ == "__main__":
@@ -309,5 +540,10 @@ if __name__ == "__main__":
     except Exception:
         logging.exception("MCP server crashed")
         raise
+    finally:
+        try:
+            asyncio.run(_close_client())
+        except Exception:
+            pass
 
 
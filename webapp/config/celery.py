@@ -6,6 +6,19 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
 app = Celery('gui_spector_webapp')
 app.config_from_object('django.conf:settings', namespace='CELERY')
+# Verification runs are long; prefetching extra messages would park queued
+# runs behind busy workers instead of letting any free worker pick them up
+app.conf.worker_prefetch_multiplier = 1
+# Long verification runs and fast periodic maintenance live on separate
+# queues so a minutes-long agent run never starves the lease reaper.
+# Run one worker per queue, e.g.:
+#   celery -A config worker -Q runs
+#   celery -A config worker -Q maintenance,celery
+app.conf.task_routes = {
+    'setups.tasks.run_verification_task': {'queue': 'runs'},
+    'setups.tasks.extract_and_capture_task': {'queue': 'runs'},
+    'setups.tasks.reap_display_leases': {'queue': 'maintenance'},
+}
 app.autodiscover_tasks()
 
 # Periodic tasks
@@ -13,5 +26,6 @@ app.conf.beat_schedule = {
     'reap-display-leases-every-minute': {
         'task': 'setups.tasks.reap_display_leases',
         'schedule': crontab(minute='*/1'),
+        'options': {'queue': 'maintenance'},
     }
 }
\ No newline at end of file
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.6 on 2026-08-30 10:12
+
+import django.core.validators
+from django.db import migrations, models
+from django.db.models import Q
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('settings', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='settingsmodel',
+            name='num_workers',
+            field=models.PositiveSmallIntegerField(default=2, validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(5)]),
+        ),
+        migrations.AddConstraint(
+            model_name='settingsmodel',
+            constraint=models.CheckConstraint(check=Q(num_workers__gte=1) & Q(num_workers__lte=5), name='num_workers_1_5'),
+        ),
+    ]
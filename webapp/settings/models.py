@@ -1,23 +1,88 @@
+import time
+
+from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
+from django.db.models import Max, Q
 
 # Create your models here.
 
+# Process-local cache for the latest settings row, keyed on max(created_at).
+# The key check is a cheap aggregate (index-backed MAX) instead of fetching
+# the full row on every call; saving new settings bumps the key naturally
+# and save() clears the cache for the current process.
+_LATEST_CACHE = None  # tuple (created_at, SettingsModel) | None
+_LATEST_CHECKED_MONOTONIC = 0.0  # when the cache key was last validated
+# created_at of the settings row whose keys were last exported to os.environ
+_LAST_APPLIED_TS = None
+
+
 class SettingsModel(models.Model):
     openai_key = models.CharField(max_length=512)
     google_api_key = models.CharField(max_length=512, blank=True, null=True)
     anthropic_api_key = models.CharField(max_length=512, blank=True, null=True)
-    # Number of parallel workers/displays to run. Must be between 1 and 5.
-    num_workers = models.PositiveIntegerField(default=2)
+    # Number of parallel workers/displays to run. Must be between 1 and 5;
+    # the range is enforced in Python (validators) and in the database
+    # (check constraint below).
+    num_workers = models.PositiveSmallIntegerField(
+        default=2,
+        validators=[MinValueValidator(1), MaxValueValidator(5)],
+    )
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        constraints = [
+            models.CheckConstraint(
+                check=Q(num_workers__gte=1) & Q(num_workers__lte=5),
+                name="num_workers_1_5",
+            ),
+        ]
+
     def __str__(self):
         return f"Settings at {self.created_at}"
 
+    def save(self, *args, **kwargs):
+        global _LATEST_CACHE
+        super().save(*args, **kwargs)
+        _LATEST_CACHE = None
+
+
+def get_latest_settings(max_age_s=0):
+    """Return the most recent SettingsModel, cached per process.
+
+    A stale cache is detected via max(created_at); only a changed key
+    triggers a full row fetch. With ``max_age_s > 0`` a cached row that was
+    validated within the window is returned without any query at all, which
+    callers on hot paths (one call per verification task) use to skip the
+    per-call roundtrip.
+    """
+    global _LATEST_CACHE, _LATEST_CHECKED_MONOTONIC
+    if (
+        max_age_s > 0
+        and _LATEST_CACHE is not None
+        and time.monotonic() - _LATEST_CHECKED_MONOTONIC < max_age_s
+    ):
+        return _LATEST_CACHE[1]
+    latest_ts = SettingsModel.objects.aggregate(Max('created_at'))['created_at__max']
+    _LATEST_CHECKED_MONOTONIC = time.monotonic()
+    if latest_ts is None:
+        _LATEST_CACHE = None
+        return None
+    if _LATEST_CACHE is not None and _LATEST_CACHE[0] == latest_ts:
+        return _LATEST_CACHE[1]
+    latest_settings = SettingsModel.objects.order_by('-created_at').first()
+    if latest_settings is not None:
+        _LATEST_CACHE = (latest_settings.created_at, latest_settings)
+    return latest_settings
+
 
 def set_api_keys_from_settings():
     import os
-    latest_settings = SettingsModel.objects.order_by('-created_at').first()
+    global _LAST_APPLIED_TS
+    latest_settings = get_latest_settings(max_age_s=30)
     if latest_settings:
+        if latest_settings.created_at == _LAST_APPLIED_TS:
+            return
+        _LAST_APPLIED_TS = latest_settings.created_at
         if latest_settings.openai_key:
             os.environ["OPENAI_API_KEY"] = latest_settings.openai_key
             print(f"OPENAI_API_KEY: {latest_settings.openai_key}")
@@ -27,9 +92,3 @@ def set_api_keys_from_settings():
         if latest_settings.google_api_key:
             os.environ["GOOGLE_API_KEY"] = latest_settings.google_api_key
             print(f"GOOGLE_API_KEY: {latest_settings.google_api_key}")
-
-
-
-
-
-
@@ -1,6 +1,6 @@
 from django.shortcuts import render, redirect
 from django.views import View
-from .models import SettingsModel  # Ensure correct import
+from .models import SettingsModel, get_latest_settings  # Ensure correct import
 from django import forms
 
 # Form for the SettingsModel to handle OpenAI key input
@@ -20,9 +20,8 @@ class SettingsView(View):
     template_name = 'settings/settings.html'
 
     def get(self, request):
-        # Use the model manager to fetch the latest settings
-        # type: ignore[attr-defined] is used to suppress linter error for Django model manager
-        latest_settings = SettingsModel.objects.order_by('-created_at').first()  # type: ignore[attr-defined]
+        # Fetch the latest settings through the process-local cache
+        latest_settings = get_latest_settings()
         form = SettingsForm(instance=latest_settings)
         return render(request, self.template_name, {'form': form})
 
@@ -113,22 +113,19 @@ class SetupEditForm(forms.ModelForm):
         ),
     )
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        # Convert plain CharFields into ChoiceFields populated like Add page options
-        current_llm = (self.instance.llm_model if getattr(self.instance, "llm_model", None) else None)
-        current_agent = (self.instance.agent_model if getattr(self.instance, "agent_model", None) else None)
-        self.fields["llm_model"] = forms.ChoiceField(
-            choices=AVAILABLE_MODELS,
-            initial=current_llm,
-            label=self.fields.get("llm_model").label if self.fields.get("llm_model") else "LLM Model",
-            widget=forms.Select(attrs={"class": "form-select"}),
-            required=True,
-        )
-        self.fields["agent_model"] = forms.ChoiceField(
-            choices=AVAILABLE_AGENTS,
-            initial=current_agent,
-            label=self.fields.get("agent_model").label if self.fields.get("agent_model") else "MLLM Agent",
-            widget=forms.Select(attrs={"class": "form-select"}),
-            required=True,
-        )
+    # Declared once at class definition instead of rebuilt in every
+    # __init__; Django's declared-fields metaclass lets these override the
+    # model CharFields, and the form machinery fills initial values from
+    # the bound instance automatically.
+    llm_model = forms.ChoiceField(
+        choices=AVAILABLE_MODELS,
+        label="LLM Model",
+        widget=forms.Select(attrs={"class": "form-select"}),
+        required=True,
+    )
+    agent_model = forms.ChoiceField(
+        choices=AVAILABLE_AGENTS,
+        label="MLLM Agent",
+        widget=forms.Select(attrs={"class": "form-select"}),
+        required=True,
+    )
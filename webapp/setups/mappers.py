@@ -15,10 +15,18 @@ from gui_spector.models.inputs import Inputs as FWInputs
 from .models import Requirement, Setup, VerificationRun, RunInteraction, AcceptanceCriterion as DBAcceptanceCriterion, Inputs as DBInputs
 
 
-def _create_db_criteria(requirement: Requirement, criteria: list[AcceptanceCriterion] | None) -> None:
-    if not criteria:
-        return
+def build_criteria_instances(requirement: Requirement, fw_req: FWRequirements) -> list[DBAcceptanceCriterion]:
+    """Build unsaved AcceptanceCriterion rows for a requirement.
+
+    Callers creating several requirements at once collect these and issue a
+    single bulk_create across all of them instead of one insert batch per
+    requirement.
+    """
     objs: list[DBAcceptanceCriterion] = []
+    try:
+        criteria = list(fw_req.acceptance_criteria or [])
+    except Exception:
+        return objs
     for c in criteria:
         try:
             objs.append(
@@ -31,8 +39,7 @@ def _create_db_criteria(requirement: Requirement, criteria: list[AcceptanceCrite
             )
         except Exception:
             continue
-    if objs:
-        DBAcceptanceCriterion.objects.bulk_create(objs)
+    return objs
 
 
 def _criteria_from_db(requirement: Requirement) -> list[AcceptanceCriterion]:
@@ -101,7 +108,9 @@ def model_to_framework(m: Requirement) -> FWRequirements:
 
 def create_model_criteria_from_framework(model_req: Requirement, fw_req: FWRequirements) -> None:
     try:
-        _create_db_criteria(model_req, list(fw_req.acceptance_criteria or []))
+        objs = build_criteria_instances(model_req, fw_req)
+        if objs:
+            DBAcceptanceCriterion.objects.bulk_create(objs)
     except Exception:
         pass
 
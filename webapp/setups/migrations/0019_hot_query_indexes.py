@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("setups", "0018_inputs_setup_inputs"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="requirement",
+            index=models.Index(fields=["setup", "created_at"], name="req_setup_created"),
+        ),
+        migrations.AddIndex(
+            model_name="requirement",
+            index=models.Index(fields=["setup", "status"], name="req_setup_status"),
+        ),
+        migrations.AddIndex(
+            model_name="verificationrun",
+            index=models.Index(fields=["requirement", "-created_at"], name="vr_req_created_desc"),
+        ),
+    ]
@@ -114,6 +114,12 @@ class Requirement(models.Model):
 
     class Meta:
         ordering = ["created_at"]
+        indexes = [
+            # Listing endpoints order a setup's requirements by created_at
+            models.Index(fields=["setup", "created_at"], name="req_setup_created"),
+            # Status counters and unprocessed-queue lookups filter on these
+            models.Index(fields=["setup", "status"], name="req_setup_status"),
+        ]
 
     def __str__(self) -> str:
         return self.title or (self.description[:40] + ("..." if len(self.description) > 40 else "")) or f"Requirement #{self.pk}"
@@ -165,6 +171,10 @@ class VerificationRun(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # Latest-run lookups order by created_at within a requirement
+            models.Index(fields=["requirement", "-created_at"], name="vr_req_created_desc"),
+        ]
 
 
 class RunInteraction(models.Model):
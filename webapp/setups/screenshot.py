@@ -1,8 +1,55 @@
 from typing import Optional
 import asyncio
+import base64
+import threading
 from playwright.async_api import async_playwright
 
 
+# One headless Chromium is kept warm per process and shared by every
+# capture: launching a browser dominates capture cost, while renting a
+# fresh BrowserContext per call is orders of magnitude cheaper and still
+# gives each capture isolated cookies/storage. All Playwright calls run
+# on a single persistent event loop in a daemon thread (same pattern as
+# the broadcast loop in setups.tasks).
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_LOOP_LOCK = threading.Lock()
+_PLAYWRIGHT = None
+_BROWSER = None
+_BROWSER_LOCK: Optional[asyncio.Lock] = None
+
+_LAUNCH_ARGS = [
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+]
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _LOOP
+    if _LOOP is None or _LOOP.is_closed():
+        with _LOOP_LOCK:
+            if _LOOP is None or _LOOP.is_closed():
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="screenshotter", daemon=True).start()
+                _LOOP = loop
+    return _LOOP
+
+
+async def _get_browser():
+    """Return the shared browser, launching (or relaunching) it if needed."""
+    global _PLAYWRIGHT, _BROWSER, _BROWSER_LOCK
+    if _BROWSER_LOCK is None:
+        _BROWSER_LOCK = asyncio.Lock()
+    async with _BROWSER_LOCK:
+        if _BROWSER is not None and _BROWSER.is_connected():
+            return _BROWSER
+        if _PLAYWRIGHT is None:
+            _PLAYWRIGHT = await async_playwright().start()
+        _BROWSER = await _PLAYWRIGHT.chromium.launch(headless=True, args=_LAUNCH_ARGS)
+        return _BROWSER
+
+
 class PlaywrightScreenshotter:
     """Simple helper to capture a full-page PNG screenshot for a given URL using headless Chromium."""
 
@@ -15,39 +62,35 @@ class PlaywrightScreenshotter:
         if not url:
             return None
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True, args=[
-                    "--no-sandbox",
-                    "--disable-setuid-sandbox",
-                    "--disable-gpu",
-                    "--disable-dev-shm-usage",
-                ])
-                context = await browser.new_context(viewport={"width": self.viewport_width, "height": self.viewport_height})
+            browser = await _get_browser()
+            context = await browser.new_context(viewport={"width": self.viewport_width, "height": self.viewport_height})
+            try:
                 page = await context.new_page()
                 await page.goto(url, wait_until="networkidle", timeout=self.timeout_ms)
                 await page.wait_for_load_state("domcontentloaded")
-                image_bytes = await page.screenshot(full_page=True, type="png")
+                # Capture via a raw CDP command: captureBeyondViewport gives a
+                # full-page shot without Playwright's screenshot orchestration
+                # (viewport resizing and the extra protocol round-trips).
+                try:
+                    session = await context.new_cdp_session(page)
+                    try:
+                        result = await session.send(
+                            "Page.captureScreenshot",
+                            {"format": "png", "captureBeyondViewport": True},
+                        )
+                        return base64.b64decode(result["data"])
+                    finally:
+                        await session.detach()
+                except Exception:
+                    # CDP path is Chromium-only; fall back to the portable API
+                    return await page.screenshot(full_page=True, type="png")
+            finally:
                 await context.close()
-                await browser.close()
-                return image_bytes
         except Exception as e:
             print(f"Error capturing screenshot: {e}")
             return None
 
     def capture_to_bytes(self, url: str) -> Optional[bytes]:
         """Navigate to the URL and return a PNG screenshot as bytes. Returns None on failure."""
-        try:
-            return asyncio.run(self._capture_to_bytes_async(url))
-        except RuntimeError:
-            # If an event loop is already running (e.g., within certain servers), use a dedicated loop
-            loop = asyncio.new_event_loop()
-            try:
-                asyncio.set_event_loop(loop)
-                return loop.run_until_complete(self._capture_to_bytes_async(url))
-            finally:
-                try:
-                    loop.close()
-                finally:
-                    asyncio.set_event_loop(None)
-
-
+        future = asyncio.run_coroutine_threadsafe(self._capture_to_bytes_async(url), _get_loop())
+        return future.result()
@@ -1,50 +1,236 @@
 from __future__ import annotations
 
+import asyncio
+import logging
+import os
+import threading
+import time
+import traceback
+from functools import lru_cache
+
 from celery import shared_task
 from celery.schedules import crontab
 from django.utils import timezone
 from pathlib import Path
-from asgiref.sync import async_to_sync
 from channels.layers import get_channel_layer
 from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Q
+
+from django.core.files.base import ContentFile
 
-from .models import Requirement, VerificationRun, AcceptanceCriterion
-from .mappers import model_to_framework, framework_run_to_models, inputs_model_to_framework
+from .models import Setup, Requirement, VerificationRun, AcceptanceCriterion
+from .mappers import (
+    model_to_framework,
+    framework_to_model,
+    framework_run_to_models,
+    inputs_model_to_framework,
+    build_criteria_instances,
+    verificationrun_status_to_requirement_status,
+)
+from .screenshot import PlaywrightScreenshotter
 from gui_spector.verfication.agent import VerficationRunner, PROMPT_TEMPLATE_V1
 from gui_spector.computers.docker import DockerComputer
+from gui_spector.processor.app_extractor import AppExtractor
+from gui_spector.processor.requirements_processor import RequirementsProcessor
+from gui_spector.processor.parallel import extract_app_and_requirements
+from gui_spector.models.requirements import RequirementsPriority
+from gui_spector.llm.llm import LLM
 from .resource_manager import DisplayPool
 from settings.models import set_api_keys_from_settings
 
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+
+    def _json_dumps_str(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:  # pragma: no cover - orjson is in requirements
+    import json
+
+    def _json_dumps_str(obj) -> str:
+        return json.dumps(obj)
+
+
+# Broadcast infrastructure shared across tasks in this worker process: the
+# channel layer is resolved once, and all group sends run on a single
+# long-lived event loop in a daemon thread. async_to_sync previously built
+# and tore down a loop bridge for every event.
+_CHANNEL_LAYER = None
+_SEND_LOOP: asyncio.AbstractEventLoop | None = None
+_SEND_LOOP_LOCK = threading.Lock()
+
+# Last payload sent to the setups group per setup id; identical consecutive
+# updates (common during long runs where counters do not change) are dropped
+_LAST_SETUP_PAYLOAD: dict[int, tuple] = {}
+_LAST_SETUP_PAYLOAD_LOCK = threading.Lock()
+
+# Normalized status spellings the model may emit for acceptance criteria
+_MET_TOKENS = frozenset({"met", "pass", "true", "yes", "1"})
+_UNMET_TOKENS = frozenset({"unmet", "fail", "false", "no", "0"})
+
+
+def _get_channel_layer_cached():
+    global _CHANNEL_LAYER
+    if _CHANNEL_LAYER is None:
+        _CHANNEL_LAYER = get_channel_layer()
+    return _CHANNEL_LAYER
+
+
+def _get_send_loop() -> asyncio.AbstractEventLoop:
+    global _SEND_LOOP
+    if _SEND_LOOP is None or _SEND_LOOP.is_closed():
+        with _SEND_LOOP_LOCK:
+            if _SEND_LOOP is None or _SEND_LOOP.is_closed():
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="ws-broadcast", daemon=True).start()
+                _SEND_LOOP = loop
+    return _SEND_LOOP
+
+
+async def _send_all(sends: list) -> None:
+    layer = _get_channel_layer_cached()
+    for group, msg in sends:
+        try:
+            await layer.group_send(group, msg)
+        except Exception as e:
+            logger.debug("group_send to %s failed: %s", group, e)
+
 
 def _broadcast(req_id: int, event: dict) -> None:
+    # No channel layer configured: nothing to send, skip all payload work
+    if _get_channel_layer_cached() is None:
+        return
+    # Serialize once here; every subscribed client reuses the same frame
+    # text instead of each consumer re-running json.dumps on the dict
+    sends = [(f"runs_{req_id}", {"type": "run.progress", "payload_text": _json_dumps_str(event)})]
+    # If this event includes a setup_id and state, also notify setups group
+    setup_id = event.get("setup_id")
+    setup_state = event.get("setup_state")
+    if setup_id and setup_state:
+        payload = {"setup_id": setup_id, "state": setup_state}
+        # forward counters when provided
+        if "num_met" in event:
+            payload["num_met"] = event.get("num_met")
+        if "num_unmet" in event:
+            payload["num_unmet"] = event.get("num_unmet")
+        if "num_processing" in event:
+            payload["num_processing"] = event.get("num_processing")
+        if "num_error" in event:
+            payload["num_error"] = event.get("num_error")
+        if "num_unprocessed" in event:
+            payload["num_unprocessed"] = event.get("num_unprocessed")
+        signature = (
+            setup_state,
+            payload.get("num_met"),
+            payload.get("num_unmet"),
+            payload.get("num_processing"),
+            payload.get("num_error"),
+            payload.get("num_unprocessed"),
+        )
+        with _LAST_SETUP_PAYLOAD_LOCK:
+            changed = _LAST_SETUP_PAYLOAD.get(setup_id) != signature
+            if changed:
+                _LAST_SETUP_PAYLOAD[setup_id] = signature
+        if changed:
+            sends.append(("setups", {"type": "setup.update", "payload_text": _json_dumps_str(payload)}))
+    # Fire and forget: submissions are queued FIFO on the shared loop, so
+    # per-requirement ordering is preserved without blocking the task.
+    # Only the send submission is guarded, and failures are logged instead
+    # of silently swallowed so channel backpressure stays visible.
     try:
-        channel_layer = get_channel_layer()
-        async_to_sync(channel_layer.group_send)(
-            f"runs_{req_id}",
-            {"type": "run.progress", "payload": event},
+        asyncio.run_coroutine_threadsafe(_send_all(sends), _get_send_loop())
+    except Exception as e:
+        logger.debug("WebSocket broadcast failed req_id=%s: %s", req_id, e)
+
+
+class _BroadcastBatcher:
+    """Coalesces per-turn progress events into a single WebSocket frame.
+
+    Chatty agent runs emit one event per turn, and every _broadcast call
+    pays the async_to_sync loop bridge plus a frame per subscribed tab.
+    Progress events are buffered and flushed as one progress_batch payload
+    once the buffer reaches `max_events` or `max_age_s` passed since the
+    last flush; lifecycle events (waiting_for_display/started/finished)
+    bypass the batcher entirely.
+    """
+
+    def __init__(self, req_id: int, max_events: int = 10, max_age_s: float = 0.05) -> None:
+        self.req_id = req_id
+        self.max_events = max_events
+        self.max_age_s = max_age_s
+        self._events: list[dict] = []
+        self._last_flush = time.monotonic()
+
+    def add(self, event: dict) -> None:
+        self._events.append(event)
+        if len(self._events) >= self.max_events or (time.monotonic() - self._last_flush) > self.max_age_s:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._events:
+            self._last_flush = time.monotonic()
+            return
+        events, self._events = self._events, []
+        self._last_flush = time.monotonic()
+        if len(events) == 1:
+            _broadcast(self.req_id, events[0])
+        else:
+            _broadcast(self.req_id, {"phase": "progress_batch", "events": events})
+
+
+@lru_cache(maxsize=1)
+def _media_root() -> Path:
+    return Path(settings.MEDIA_ROOT).resolve()
+
+
+@lru_cache(maxsize=1)
+def _media_root_prefix_str() -> str:
+    return str(_media_root()) + os.sep
+
+
+@lru_cache(maxsize=1)
+def _media_url_prefix() -> str:
+    return settings.MEDIA_URL.rstrip("/") + "/"
+
+
+def _to_media_url(path_str) -> str | None:
+    """Map an absolute filesystem path under MEDIA_ROOT to its public URL.
+
+    Paths the task itself produced already start with the resolved media
+    root, so the common case is a pure string slice with no filesystem
+    access; anything else falls back to a resolve() before the check.
+    Returns None for paths outside the media root (or unreadable ones).
+    """
+    s = str(path_str)
+    root = _media_root_prefix_str()
+    if s.startswith(root):
+        return _media_url_prefix() + s[len(root):].replace(os.sep, "/")
+    try:
+        rel = Path(s).resolve().relative_to(_media_root())
+        return _media_url_prefix() + rel.as_posix()
+    except Exception:
+        return None
+
+
+def _status_counts(setup) -> dict:
+    """Return all requirement status counters for a setup in one query.
+
+    Conditional aggregation collapses the five per-status COUNT round-trips
+    into a single SELECT; counters fall back to None when the query fails so
+    broadcasts keep their previous shape.
+    """
+    try:
+        return setup.requirements.aggregate(
+            met=Count("id", filter=Q(status=Requirement.Status.MET)),
+            unmet=Count("id", filter=Q(status=Requirement.Status.UNMET)),
+            processing=Count("id", filter=Q(status=Requirement.Status.PROCESSING)),
+            error=Count("id", filter=Q(status=Requirement.Status.ERROR)),
+            unprocessed=Count("id", filter=Q(status=Requirement.Status.UNPROCESSED)),
         )
-        # If this event includes a setup_id and state, also notify setups group
-        setup_id = event.get("setup_id")
-        setup_state = event.get("setup_state")
-        if setup_id and setup_state:
-            payload = {"setup_id": setup_id, "state": setup_state}
-            # forward counters when provided
-            if "num_met" in event:
-                payload["num_met"] = event.get("num_met")
-            if "num_unmet" in event:
-                payload["num_unmet"] = event.get("num_unmet")
-            if "num_processing" in event:
-                payload["num_processing"] = event.get("num_processing")
-            if "num_error" in event:
-                payload["num_error"] = event.get("num_error")
-            if "num_unprocessed" in event:
-                payload["num_unprocessed"] = event.get("num_unprocessed")
-            async_to_sync(channel_layer.group_send)(
-                "setups",
-                {"type": "setup.update", "payload": payload},
-            )
     except Exception:
-        pass
+        return {"met": None, "unmet": None, "processing": None, "error": None, "unprocessed": None}
 
 
 def _update_acceptance_states_from_decision(requirement: Requirement, decision: dict) -> None:
@@ -63,6 +249,8 @@ def _update_acceptance_states_from_decision(requirement: Requirement, decision:
         # Build map of name -> AcceptanceCriterion
         by_name = {}
         try:
+            # .all() reuses the prefetch cache from the task's initial
+            # Requirement fetch instead of issuing a fresh SELECT
             for c in requirement.criteria.all():
                 n = (c.name or "").strip().upper()
                 if n:
@@ -87,72 +275,72 @@ def _update_acceptance_states_from_decision(requirement: Requirement, decision:
                 new_state = AcceptanceCriterion.State.MET if met_val else AcceptanceCriterion.State.UNMET
             else:
                 status_raw = str(item.get("status", "")).strip().lower()
-                if status_raw in ["met", "pass", "true", "yes", "1"]:
+                if status_raw in _MET_TOKENS:
                     new_state = AcceptanceCriterion.State.MET
-                elif status_raw in ["unmet", "fail", "false", "no", "0"]:
+                elif status_raw in _UNMET_TOKENS:
                     new_state = AcceptanceCriterion.State.UNMET
                 else:
                     continue
             if target.state != new_state:
                 updates.append((target, new_state))
-        for obj, st in updates:
+        if updates:
             try:
-                obj.state = st
-                obj.save(update_fields=["state"])
+                to_save = []
+                for obj, st in updates:
+                    obj.state = st
+                    to_save.append(obj)
+                # One multi-row UPDATE instead of one statement per criterion
+                with transaction.atomic():
+                    AcceptanceCriterion.objects.bulk_update(to_save, ["state"], batch_size=500)
             except Exception:
                 pass
     except Exception:
         # Never fail the task because of state sync
         pass
 
-@shared_task(bind=True)
+@shared_task(bind=True, acks_late=True, queue="runs")
 def run_verification_task(self, requirement_id: int) -> int:
     # Ensure API keys from latest settings are applied before any LLM/agent usage
     try:
         set_api_keys_from_settings()
     except Exception:
         pass
-    req = Requirement.objects.get(pk=requirement_id)
+    # Hydrate the setup and criteria up front; the task reads req.setup
+    # immediately and the decision updater walks req.criteria later.
+    # Deliberately no only()/defer(): model_to_framework consumes nearly
+    # every column (title, description, text, tags_json, metadata_json, ...),
+    # so a narrowed fetch would just trigger deferred-field queries later.
+    req = (
+        Requirement.objects.select_related("setup")
+        .prefetch_related("criteria")
+        .get(pk=requirement_id)
+    )
     setup = req.setup
     pool = DisplayPool(lease_ttl_seconds=int(getattr(setup, 'agent_timeout_seconds', 120)))
 
-    # Create a pending VerificationRun first (no display yet)
-    pending = VerificationRun.objects.create(
-        requirement=req,
-        status=VerificationRun.Status.PROCESSING,
-        started_at=timezone.now(),
-        finished_at=timezone.now(),
-        elapsed_s=0.0,
-        start_url=setup.start_url,
-        current_url=None,
-        steps_taken=0,
-        run_dir=str(Path("runs") / "pending"),
-        display_str=None,
-    )
-    # Mark requirement/setup as processing immediately so refresh reflects state
-    try:
-        req.status = Requirement.Status.PROCESSING
-        req.save(update_fields=["status"]) 
-    except Exception:
-        pass
-    try:
-        setup.state = setup.State.PROCESSING
-        setup.save(update_fields=["state"]) 
-    except Exception:
-        pass
-    # Include current counters
-    try:
-        num_met = setup.requirements.filter(status=Requirement.Status.MET).count()
-        num_unmet = setup.requirements.filter(status=Requirement.Status.UNMET).count()
-        num_processing = setup.requirements.filter(status=Requirement.Status.PROCESSING).count()
-        num_error = setup.requirements.filter(status=Requirement.Status.ERROR).count()
-        num_unprocessed = setup.requirements.filter(status=Requirement.Status.UNPROCESSED).count()
-    except Exception:
-        num_met = None
-        num_unmet = None
-        num_processing = None
-        num_error = None
-        num_unprocessed = None
+    # Create a pending VerificationRun and mark requirement/setup as
+    # processing in one commit instead of three autonomous ones
+    with transaction.atomic():
+        pending = VerificationRun.objects.create(
+            requirement=req,
+            status=VerificationRun.Status.PROCESSING,
+            started_at=timezone.now(),
+            finished_at=timezone.now(),
+            elapsed_s=0.0,
+            start_url=setup.start_url,
+            current_url=None,
+            steps_taken=0,
+            run_dir=str(Path("runs") / "pending"),
+            display_str=None,
+        )
+        if req.status != Requirement.Status.PROCESSING:
+            req.status = Requirement.Status.PROCESSING
+            req.save(update_fields=["status"])
+        if setup.state != setup.State.PROCESSING:
+            setup.state = setup.State.PROCESSING
+            setup.save(update_fields=["state", "updated_at"])
+    # Include current counters (single aggregate query)
+    counts = _status_counts(setup)
     # Notify UI that this run is queued and waiting for a display
     _broadcast(
         req.id,
@@ -163,42 +351,45 @@ def run_verification_task(self, requirement_id: int) -> int:
             "requirement_status": req.status,
             "setup_id": setup.id,
             "setup_state": setup.state,
-            "num_met": num_met,
-            "num_unmet": num_unmet,
-            "num_processing": num_processing,
-            "num_error": num_error,
-            "num_unprocessed": num_unprocessed,
+            "num_met": counts["met"],
+            "num_unmet": counts["unmet"],
+            "num_processing": counts["processing"],
+            "num_error": counts["error"],
+            "num_unprocessed": counts["unprocessed"],
         },
     )
 
-    # Block until a display is available
-    disp = pool.acquire(requirement_id, block_timeout=0)  # 0 = wait indefinitely
+    # Bounded wait for a display: blocking indefinitely pins this prefork
+    # slot while it holds no resource. On timeout the placeholder run is
+    # dropped and the task requeues itself, freeing the slot between polls.
+    try:
+        disp = pool.acquire(requirement_id, block_timeout=5)
+    except TimeoutError:
+        try:
+            pending.delete()
+        except Exception:
+            pass
+        raise self.retry(countdown=5, max_retries=None)
     # Update run with acquired display
     pending.display_str = disp
-    pending.save()
+    pending.save(update_fields=["display_str"])
 
     # Notify UI that the run actually started processing with a display
-    req.status = Requirement.Status.PROCESSING
-    req.save()
+    # (already marked PROCESSING above; avoid a redundant full-row UPDATE)
+    if req.status != Requirement.Status.PROCESSING:
+        req.status = Requirement.Status.PROCESSING
+        req.save(update_fields=["status"])
     try:
-        setup.state = setup.State.PROCESSING
-        setup.save(update_fields=["state"])
+        if setup.state != setup.State.PROCESSING:
+            setup.state = setup.State.PROCESSING
+            setup.save(update_fields=["state", "updated_at"])
     except Exception:
         pass
-    # Include current counters
-    try:
-        num_met = setup.requirements.filter(status=Requirement.Status.MET).count()
-        num_unmet = setup.requirements.filter(status=Requirement.Status.UNMET).count()
-        num_processing = setup.requirements.filter(status=Requirement.Status.PROCESSING).count()
-        num_error = setup.requirements.filter(status=Requirement.Status.ERROR).count()
-        num_unprocessed = setup.requirements.filter(status=Requirement.Status.UNPROCESSED).count()
-    except Exception:
-        num_met = None
-        num_unmet = None
-        num_processing = None
-        num_error = None
-        num_unprocessed = None
-    _broadcast(req.id, {"phase": "started", "run_id": pending.id, "requirement_status": req.status, "setup_id": setup.id, "setup_state": setup.state, "num_met": num_met, "num_unmet": num_unmet, "num_processing": num_processing, "num_error": num_error, "num_unprocessed": num_unprocessed})
+    # Include current counters (single aggregate query)
+    counts = _status_counts(setup)
+    _broadcast(req.id, {"phase": "started", "run_id": pending.id, "requirement_status": req.status, "setup_id": setup.id, "setup_state": setup.state, "num_met": counts["met"], "num_unmet": counts["unmet"], "num_processing": counts["processing"], "num_error": counts["error"], "num_unprocessed": counts["unprocessed"]})
+
+    batcher = _BroadcastBatcher(req.id)
 
     def progress_cb(ev: dict):
         # ev: {event: 'turn', step_counter, turn_elapsed_s, reasoning_summary, message_text, screenshot_path, last_action{type,status}}
@@ -206,23 +397,19 @@ def run_verification_task(self, requirement_id: int) -> int:
         pool.heartbeat(disp)
         payload = {"phase": "progress", "run_id": pending.id, **ev}
         # If we have a filesystem screenshot path, convert to MEDIA URL for the frontend
-        try:
-            sp = ev.get("screenshot_path")
-            if sp:
-                p = Path(sp).resolve()
-                media_root = Path(settings.MEDIA_ROOT).resolve()
-                if media_root in p.parents or p == media_root:
-                    rel = p.relative_to(media_root).as_posix()
-                    payload["screenshot_url"] = f"{settings.MEDIA_URL.rstrip('/')}/{rel}"
-        except Exception:
-            pass
-        _broadcast(req.id, payload)
+        sp = ev.get("screenshot_path")
+        if sp:
+            url = _to_media_url(sp)
+            if url:
+                payload["screenshot_url"] = url
+        batcher.add(payload)
 
     data_root = Path(__file__).resolve().parent.parent / "media" / "runs"
-    data_root.mkdir(exist_ok=True, parents=True)
-    # Deterministic run directory with zero-padded IDs: runs/SSS/RRR/NNN
-    run_dir = data_root / f"{setup.id:03d}" / f"{req.id:03d}" / f"{pending.id:03d}"
-    run_dir.mkdir(exist_ok=False, parents=True)
+    # Deterministic run directory with zero-padded IDs: runs/SSS/RRR/NNN;
+    # parents=True creates the whole hierarchy (including data_root) in one
+    # call instead of a separate mkdir per level
+    run_dir = data_root.joinpath(f"{setup.id:03d}", f"{req.id:03d}", f"{pending.id:03d}")
+    run_dir.mkdir(parents=True, exist_ok=False)
     # Persist run_dir early so UI/debug can see it immediately
     pending.run_dir = str(run_dir)
     pending.save(update_fields=["run_dir"])
@@ -264,7 +451,7 @@ def run_verification_task(self, requirement_id: int) -> int:
                     raise
 
         run_model, interactions = framework_run_to_models(req, result)
-        for field in [
+        result_fields = [
             "status",
             "finished_at",
             "elapsed_s",
@@ -275,31 +462,36 @@ def run_verification_task(self, requirement_id: int) -> int:
             "error",
             "usage_total_json",
             "last_screenshot",
-        ]:
+        ]
+        for field in result_fields:
             setattr(pending, field, getattr(run_model, field))
-        pending.save()
-        # Persisted; now sync acceptance criterion states from final decision
-        try:
-            _update_acceptance_states_from_decision(req, pending.model_decision_json or {})
-        except Exception:
-            pass
-        # Update requirement status based on run result
-        from .mappers import verificationrun_status_to_requirement_status
-        req.status = verificationrun_status_to_requirement_status(pending.status)
-        req.save()
-        # Update setup state: processing if any requirement processing, else ready (success)
-        try:
-            if req.setup.requirements.filter(status=Requirement.Status.PROCESSING).exists():
-                setup.state = setup.State.PROCESSING
-            else:
-                setup.state = setup.State.READY
-            setup.save(update_fields=["state"])
-        except Exception:
-            pass
-        if interactions:
-            for it in interactions:
-                it.run = pending
-                it.save()
+        # Persist the whole result (run fields, criterion states, requirement
+        # status, setup state, interactions) as one commit; previously each
+        # save flushed its own transaction
+        with transaction.atomic():
+            pending.save(update_fields=result_fields)
+            # Persisted; now sync acceptance criterion states from final decision
+            try:
+                _update_acceptance_states_from_decision(req, pending.model_decision_json or {})
+            except Exception:
+                pass
+            # Update requirement status based on run result
+            new_status = verificationrun_status_to_requirement_status(pending.status)
+            if req.status != new_status:
+                req.status = new_status
+                req.save(update_fields=["status"])
+            # Derive setup state and broadcast counters from one aggregate query;
+            # processing > 0 replaces the separate exists() probe
+            counts = _status_counts(setup)
+            new_state = setup.State.PROCESSING if counts["processing"] else setup.State.READY
+            if setup.state != new_state:
+                setup.state = new_state
+                setup.save(update_fields=["state", "updated_at"])
+            if interactions:
+                # One multi-row INSERT instead of one per agent turn
+                for it in interactions:
+                    it.run = pending
+                type(interactions[0]).objects.bulk_create(interactions, batch_size=500)
 
         # Include last_screenshot_url if available
         payload = {
@@ -310,25 +502,19 @@ def run_verification_task(self, requirement_id: int) -> int:
             "steps_taken": pending.steps_taken,
             "requirement_status": req.status,
         }
-        try:
-            if pending.last_screenshot:
-                p = Path(pending.last_screenshot).resolve()
-                media_root = Path(settings.MEDIA_ROOT).resolve()
-                if media_root in p.parents or p == media_root:
-                    rel = p.relative_to(media_root).as_posix()
-                    payload["last_screenshot_url"] = f"{settings.MEDIA_URL.rstrip('/')}/{rel}"
-        except Exception:
-            pass
+        if pending.last_screenshot:
+            url = _to_media_url(pending.last_screenshot)
+            if url:
+                payload["last_screenshot_url"] = url
         payload["setup_id"] = setup.id
         payload["setup_state"] = setup.state
-        try:
-            payload["num_met"] = setup.requirements.filter(status=Requirement.Status.MET).count()
-            payload["num_unmet"] = setup.requirements.filter(status=Requirement.Status.UNMET).count()
-            payload["num_processing"] = setup.requirements.filter(status=Requirement.Status.PROCESSING).count()
-            payload["num_error"] = setup.requirements.filter(status=Requirement.Status.ERROR).count()
-            payload["num_unprocessed"] = setup.requirements.filter(status=Requirement.Status.UNPROCESSED).count()
-        except Exception:
-            pass
+        payload["num_met"] = counts["met"]
+        payload["num_unmet"] = counts["unmet"]
+        payload["num_processing"] = counts["processing"]
+        payload["num_error"] = counts["error"]
+        payload["num_unprocessed"] = counts["unprocessed"]
+        # Drain buffered progress first so the finished event arrives last
+        batcher.flush()
         _broadcast(req.id, payload)
     except Exception as e:
         # Mark run as error on any unexpected exception
@@ -339,26 +525,27 @@ def run_verification_task(self, requirement_id: int) -> int:
         except Exception:
             pending.elapsed_s = 0.0
         print(f"Run error: {e}")
-        import traceback
         traceback.print_exc()
         pending.error = str(e)
-        pending.save()
+        pending.save(update_fields=["status", "finished_at", "elapsed_s", "error"])
         # Sync acceptance criterion states from final decision in error path
         try:
             _update_acceptance_states_from_decision(req, pending.model_decision_json or {})
         except Exception:
             pass
         # Update requirement status to error/unmet
-        from .mappers import verificationrun_status_to_requirement_status
-        req.status = verificationrun_status_to_requirement_status(pending.status)
-        req.save()
-        # Update setup state: processing if any requirement processing, else ready (success)
+        new_status = verificationrun_status_to_requirement_status(pending.status)
+        if req.status != new_status:
+            req.status = new_status
+            req.save(update_fields=["status"])
+        # Derive setup state and broadcast counters from one aggregate query;
+        # processing > 0 replaces the separate exists() probe
+        counts = _status_counts(setup)
         try:
-            if req.setup.requirements.filter(status=Requirement.Status.PROCESSING).exists():
-                setup.state = setup.State.PROCESSING
-            else:
-                setup.state = setup.State.READY
-            setup.save(update_fields=["state"])
+            new_state = setup.State.PROCESSING if counts["processing"] else setup.State.READY
+            if setup.state != new_state:
+                setup.state = new_state
+                setup.save(update_fields=["state", "updated_at"])
         except Exception:
             pass
         payload = {
@@ -369,27 +556,25 @@ def run_verification_task(self, requirement_id: int) -> int:
             "steps_taken": pending.steps_taken,
             "requirement_status": req.status,
         }
-        try:
-            if pending.last_screenshot:
-                p = Path(pending.last_screenshot).resolve()
-                media_root = Path(settings.MEDIA_ROOT).resolve()
-                if media_root in p.parents or p == media_root:
-                    rel = p.relative_to(media_root).as_posix()
-                    payload["last_screenshot_url"] = f"{settings.MEDIA_URL.rstrip('/')}/{rel}"
-        except Exception:
-            pass
+        if pending.last_screenshot:
+            url = _to_media_url(pending.last_screenshot)
+            if url:
+                payload["last_screenshot_url"] = url
         payload["setup_id"] = setup.id
         payload["setup_state"] = setup.state
+        payload["num_met"] = counts["met"]
+        payload["num_unmet"] = counts["unmet"]
+        payload["num_processing"] = counts["processing"]
+        payload["num_error"] = counts["error"]
+        payload["num_unprocessed"] = counts["unprocessed"]
+        # Drain buffered progress first so the finished event arrives last
+        batcher.flush()
+        _broadcast(req.id, payload)
+    finally:
         try:
-            payload["num_met"] = setup.requirements.filter(status=Requirement.Status.MET).count()
-            payload["num_unmet"] = setup.requirements.filter(status=Requirement.Status.UNMET).count()
-            payload["num_processing"] = setup.requirements.filter(status=Requirement.Status.PROCESSING).count()
-            payload["num_error"] = setup.requirements.filter(status=Requirement.Status.ERROR).count()
-            payload["num_unprocessed"] = setup.requirements.filter(status=Requirement.Status.UNPROCESSED).count()
+            batcher.flush()
         except Exception:
             pass
-        _broadcast(req.id, payload)
-    finally:
         # Release display
         try:
             computer.cleanup_browser()
@@ -399,7 +584,120 @@ def run_verification_task(self, requirement_id: int) -> int:
     return pending.id
 
 
-@shared_task
+@shared_task(bind=True, acks_late=True, queue="runs")
+def extract_and_capture_task(self, setup_id: int, selected_llm: str, req_text: str, allow_guess: bool, raw_tags: str):
+    """Screenshot capture and LLM extraction for a freshly created setup.
+
+    add_setup persists the Setup with state=PROCESSING and redirects
+    immediately; this task performs the slow parts (Playwright screenshot,
+    AppExtractor description/tags, RequirementsProcessor requirement
+    extraction) and flips the setup back to READY at the end. The overview
+    page polls api_list_setups, which surfaces the state.
+    """
+    try:
+        setup = Setup.objects.get(pk=setup_id)
+    except Setup.DoesNotExist:
+        return
+    try:
+        set_api_keys_from_settings()
+    except Exception:
+        pass
+    updates = []
+    img_bytes = None
+    try:
+        shooter = PlaywrightScreenshotter()
+        img_bytes = shooter.capture_to_bytes(setup.start_url)
+        if img_bytes:
+            setup.screenshot.save(f"setup_{setup.pk}.png", ContentFile(img_bytes), save=False)
+            updates.append("screenshot")
+    except Exception as e:
+        print(f"Error capturing screenshot: {e}")
+    # User-provided tags always win over extracted ones
+    raw_tags = (raw_tags or "").strip()
+    if raw_tags:
+        tags = [t.strip() for t in raw_tags.replace(";", ",").split(",") if t.strip()]
+        setup.tags_json = tags
+        updates.append("tags_json")
+    # Run AppExtractor only for what is still missing: when the user
+    # supplied tags and the setup already has a description there is
+    # nothing left for the LLM round-trip to contribute
+    need_description = not setup.description
+    need_tags = not raw_tags
+    req_text = (req_text or "").strip()
+    result = None
+    extracted = []
+    try:
+        if (need_description or need_tags) and req_text:
+            # App extraction and requirements extraction are independent
+            # LLM round-trips; the combiner overlaps them so this phase
+            # costs max(t1, t2) instead of t1 + t2
+            result, extracted = extract_app_and_requirements(
+                AppExtractor(llm=LLM(model_name=selected_llm, temperature=0.05)),
+                RequirementsProcessor(llm=LLM(model_name=selected_llm, temperature=0.05)),
+                input_text=req_text,
+                image_bytes=img_bytes,
+                allow_guess=bool(allow_guess),
+                default_priority=RequirementsPriority.MEDIUM,
+                source=setup.start_url,
+            )
+        elif need_description or need_tags:
+            extractor = AppExtractor(llm=LLM(model_name=selected_llm, temperature=0.05))
+            result = extractor.extract_app(
+                image_bytes=img_bytes,
+                image_url=None,
+                requirements=None,
+                requirements_text="",
+                max_tags=7,
+            )
+        elif req_text:
+            processor = RequirementsProcessor(llm=LLM(model_name=selected_llm, temperature=0.05))
+            extracted = processor.process_text(
+                input_text=req_text,
+                allow_guess=bool(allow_guess),
+                default_priority=RequirementsPriority.MEDIUM,
+                source=setup.start_url,
+            )
+    except Exception as e:
+        print(f"Error during LLM extraction: {e}")
+    if need_description and result and getattr(result, "description", None):
+        setup.description = result.description
+        updates.append("description")
+    if need_tags and result and getattr(result, "tags", None):
+        setup.tags_json = list(result.tags)
+        updates.append("tags_json")
+    # Persist extracted requirements and their acceptance criteria
+    if extracted:
+        try:
+            bulk = [framework_to_model(setup, r) for r in extracted]
+            if bulk:
+                Requirement.objects.bulk_create(bulk)
+                # Create related acceptance criteria per requirement. MySQL
+                # cannot return PKs from bulk inserts, so the client-generated
+                # framework_id is the id-mapping key; only the two columns the
+                # mapping needs are fetched.
+                created = list(
+                    Requirement.objects.filter(setup=setup, framework_id__in=[b.framework_id for b in bulk])
+                    .only("id", "framework_id")
+                )
+                fw_map = {str(r.id): r for r in extracted}
+                all_criteria = []
+                for mr in created:
+                    fwr = fw_map.get(str(mr.framework_id))
+                    if fwr:
+                        all_criteria.extend(build_criteria_instances(mr, fwr))
+                if all_criteria:
+                    AcceptanceCriterion.objects.bulk_create(all_criteria, batch_size=500)
+        except Exception as e:
+            print(f"Error extracting requirements: {e}")
+    setup.state = Setup.State.READY
+    updates.append("state")
+    # auto_now fields are skipped when excluded from update_fields; include
+    # updated_at explicitly so the api_list_setups ETag sees this change
+    updates.append("updated_at")
+    setup.save(update_fields=updates)
+
+
+@shared_task(queue="maintenance")
 def reap_display_leases() -> int:
     pool = DisplayPool()
     return pool.reap_expired()
@@ -1,25 +1,277 @@
 from django.shortcuts import render, redirect, get_object_or_404
-from django.http import JsonResponse, HttpResponseBadRequest
-from django.views.decorators.http import require_http_methods
+from django.http import JsonResponse, HttpResponseBadRequest, StreamingHttpResponse
+from django.views.decorators.http import require_http_methods, condition
 from django.utils import timezone
-from .models import Setup, Requirement, VerificationRun, RunInteraction, Inputs
+from .models import Setup, Requirement, VerificationRun, RunInteraction, AcceptanceCriterion, Inputs
 from django.views.decorators.csrf import csrf_exempt, ensure_csrf_cookie
 from django.conf import settings
 from pathlib import Path
 from .forms import SetupForm, SetupEditForm
-from django.core.files.base import ContentFile
-from .screenshot import PlaywrightScreenshotter
-from gui_spector.processor.app_extractor import AppExtractor
 from gui_spector.processor.requirements_processor import RequirementsProcessor
 from gui_spector.models.requirements import RequirementsPriority
-from .mappers import framework_to_model, framework_run_to_models, create_model_criteria_from_framework
-from .tasks import run_verification_task
+from .mappers import framework_to_model, framework_run_to_models, build_criteria_instances
+from celery import group
+from .tasks import run_verification_task, extract_and_capture_task
 from gui_spector.llm.llm import LLM
 from gui_spector.llm.config import AVAILABLE_MODELS
 from gui_spector.verfication.config import AVAILABLE_AGENTS, DEFAULT_AGENT
+from django.core.cache import cache
 from django.db import transaction
+from django.db.models import Case, CharField, Count, F, IntegerField, Max, Prefetch, Q, TextField, Value, When
+from django.db.models.fields.json import KeyTextTransform
+from django.db.models.functions import Cast, Coalesce
+from hashlib import sha1
 from settings.models import set_api_keys_from_settings
 import json
+import re
+import sys
+import time
+from collections import namedtuple
+from functools import lru_cache
+
+# Translation table for normalizing Windows separators in stored paths
+_SLASH_TABLE = str.maketrans("\\", "/")
+
+try:
+    import orjson
+
+    def _json_dumps_bytes(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is in requirements
+
+    def _json_dumps_bytes(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+    _json_loads = json.loads
+
+
+@lru_cache(maxsize=1)
+def _current_tz():
+    return timezone.get_current_timezone()
+
+
+def _fmt_date(dt) -> str:
+    d = dt.astimezone(_current_tz())
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d}"
+
+
+def _fmt_minutes(dt) -> str:
+    d = dt.astimezone(_current_tz())
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d} {d.hour:02d}:{d.minute:02d}"
+
+
+def _fmt_seconds(dt) -> str:
+    d = dt.astimezone(_current_tz())
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d} {d.hour:02d}:{d.minute:02d}:{d.second:02d}"
+
+
+@lru_cache(maxsize=4096)
+def _fmt_thousands(n: int) -> str:
+    """Format an int with thousands separators; token counts repeat a lot
+    across polls, so the cache usually hits."""
+    return f"{n:,}"
+
+
+def _parse_inputs_mapping(raw: str) -> dict:
+    """Parse the inputs_json form payload into a {key: value} string dict.
+
+    Accepts either a list of {"key": ..., "value": ...} objects or a plain
+    mapping; items without a key are skipped. Shared by add_setup and
+    edit_setup, which previously carried duplicate inline parsers.
+    """
+    if not raw:
+        return {}
+    data = _json_loads(raw)
+    mapping: dict = {}
+    if isinstance(data, list):
+        for it in data:
+            if not isinstance(it, dict):
+                continue
+            key = str(it.get("key") or "").strip()
+            if key:
+                val = it.get("value")
+                mapping[key] = "" if val is None else str(val)
+    elif isinstance(data, dict):
+        mapping = {str(k): str(v) for k, v in data.items()}
+    return mapping
+
+
+def _stream_json_list(key: str, records) -> StreamingHttpResponse:
+    """Stream {"<key>": [...]} one record at a time.
+
+    Large list endpoints used to materialize ORM objects, a dict list and
+    the full JSON string at once; feeding records from
+    queryset.iterator() through this keeps peak memory at one record.
+    """
+    def _gen():
+        yield b'{"%s": [' % key.encode()
+        first = True
+        for rec in records:
+            if first:
+                first = False
+            else:
+                yield b","
+            yield _json_dumps_bytes(rec)
+        yield b"]}"
+
+    return StreamingHttpResponse(_gen(), content_type="application/json")
+
+
+# Key variants probed per acceptance item, in priority order
+_NAME_KEYS = ("criterion_name", "name")
+_TXT_KEYS = ("criteria", "criterion", "text", "description")
+_EXPL_KEYS = ("explanation", "why", "notes", "reason")
+_EVID_KEYS = ("evidence", "evidence_text", "proof")
+
+
+def _first(d: dict, keys: tuple):
+    """Return the first truthy value among d[k] for k in keys, else ""."""
+    for k in keys:
+        v = d.get(k)
+        if v:
+            return v
+    return ""
+
+
+# Run statuses that end a long poll: error runs finish without ever
+# writing a decision, so waiting on the decision alone would hang
+_TERMINAL_RUN_STATUSES = frozenset({
+    VerificationRun.Status.MET,
+    VerificationRun.Status.UNMET,
+    VerificationRun.Status.PARTIALLY_MET,
+    VerificationRun.Status.ERROR,
+})
+
+# Status spellings that count as "met" in acceptance results
+_MET_TRUTHY = frozenset({"met", "pass", "true", "yes", "1", "ok"})
+
+# Interaction rows are read-only in the run_detail template, so namedtuples
+# keep the same attribute access as the previous 14-key dicts at roughly a
+# third of the per-row allocation
+_InteractionRow = namedtuple(
+    "_InteractionRow",
+    (
+        "turn_index",
+        "started_at",
+        "finished_at",
+        "elapsed_s",
+        "model_response_id",
+        "reasoning_summary",
+        "message_text",
+        "screenshot_url",
+        "usage",
+        "tokens_in",
+        "tokens_out",
+        "tokens_in_fmt",
+        "tokens_out_fmt",
+        "action",
+    ),
+)
+_ActionInfo = namedtuple("_ActionInfo", ("type", "params", "call_id", "status", "safety_checks"))
+
+# Matches message bodies that are really JSON/code payloads rather than
+# prose: a whole-string JSON object, fenced code, or typical decision keys
+# next to braces. One compiled scan replaces the previous chain of
+# startswith/endswith/substring checks over the same (often long) string.
+_JSONISH_RE = re.compile(
+    r'^\{.*\}$'
+    r'|```'
+    r'|^(?=.*"status")(?=.*(?:\{"|\n\{))',
+    re.DOTALL,
+)
+
+
+def _clean_message_text(text) -> str:
+    """Return the message stripped, or "" when it looks like JSON/code."""
+    if not text:
+        return ""
+    t = str(text).strip()
+    if _JSONISH_RE.search(t):
+        return ""
+    return t
+
+
+# Decision-JSON keys that may hold the detailed summary, in priority order
+_DETAILED_KEYS = ("detailed_summary", "details", "summary_detailed", "detailed", "summary")
+
+# Requirement columns the MCP unprocessed endpoints actually serialize
+_UNPROCESSED_REQ_COLUMNS = (
+    "id",
+    "framework_id",
+    "title",
+    "description",
+    "priority",
+    "tags_json",
+    "metadata_json",
+    "status",
+    "created_at",
+)
+
+# Decision-JSON keys that may hold the acceptance-criteria results, in
+# priority order (schema varies across model/agent versions)
+_AC_KEYS = (
+    "acceptance_criteria",
+    "acceptance",
+    "acceptanceCriteria",
+    "criteria_results",
+    "acceptance_results",
+    "acceptance_criteria_results",
+    "criteria",
+    "results",
+)
+
+# Static validation sets, hoisted so no request rebuilds them
+_VALID_PRIORITIES = frozenset(Requirement.Priority.values)
+_VALID_LLMS = frozenset(v for v, _d in AVAILABLE_MODELS)
+_VALID_AGENTS = frozenset(v for v, _d in AVAILABLE_AGENTS)
+
+
+@lru_cache(maxsize=1)
+def _media_root():
+    root = getattr(settings, "MEDIA_ROOT", None)
+    return Path(root).resolve() if root else None
+
+
+@lru_cache(maxsize=1)
+def _media_url_prefix() -> str:
+    media_url = getattr(settings, "MEDIA_URL", "/media/")
+    return media_url if media_url.endswith("/") else media_url + "/"
+
+
+def _to_media_url(raw_path) -> str:
+    """Map a stored screenshot path to a browser-servable URL.
+
+    Hot in api_runs_list (once per run) and run_detail (once per
+    interaction): the common cases are pure string work; the filesystem
+    resolve() only runs when the cheap prefix checks fail.
+    """
+    if not raw_path:
+        return ""
+    s_norm = str(raw_path).translate(_SLASH_TABLE)
+    # Already a URL
+    if s_norm.startswith("http://") or s_norm.startswith("https://"):
+        return s_norm
+    # If it already contains /media/, slice from there
+    _head, sep, tail = s_norm.partition("/media/")
+    if sep:
+        return sep + tail
+    # Try MEDIA_ROOT relative mapping
+    try:
+        root = _media_root()
+        if root:
+            rel = Path(s_norm).resolve().relative_to(root)
+            return _media_url_prefix() + rel.as_posix()
+    except Exception:
+        pass
+    # As a fallback, locate 'media' path segment
+    parts = [p for p in s_norm.split("/") if p]
+    if "media" in parts:
+        m_idx = parts.index("media")
+        return _media_url_prefix() + "/".join(parts[m_idx + 1:])
+    # Last resort: treat as already absolute path under server; return as-is
+    return s_norm
 
 
 @ensure_csrf_cookie
@@ -27,13 +279,46 @@ def overview(request):
     return render(request, "setups/overview.html")
 
 
+# Conditional-GET validators for the polled list endpoints. Both endpoints
+# are hit every few seconds per open tab; a cheap aggregate that captures
+# every change the payload depends on lets unchanged polls short-circuit
+# into a body-less 304 before the view runs. Requirement status flips do
+# not touch any timestamp, so the per-status counts are part of the key.
+_STATUS_COUNT_AGGS = {
+    f"n_{value}": Count("id", filter=Q(status=value))
+    for value in Requirement.Status.values
+}
+
+
+def _setups_etag(request):
+    state = (
+        Setup.objects.aggregate(n=Count("id"), m=Max("updated_at")),
+        Requirement.objects.aggregate(n=Count("id"), m=Max("created_at"), **_STATUS_COUNT_AGGS),
+    )
+    return sha1(repr(state).encode()).hexdigest()
+
+
+def _requirements_etag(request, pk: int):
+    state = Requirement.objects.filter(setup_id=pk).aggregate(
+        n=Count("id"), m=Max("created_at"), **_STATUS_COUNT_AGGS
+    )
+    return sha1(repr(sorted(state.items())).encode()).hexdigest()
+
+
 @require_http_methods(["GET"])
+@condition(etag_func=_setups_etag)
 def api_list_setups(request):
-    print("api_list_setups")
-    setups = (
-        Setup.objects.all()
-        .select_related()
-        .prefetch_related("requirements")
+    # Counters come from conditional aggregation in the same SELECT instead
+    # of the num_* properties, which each run their own COUNT query (and the
+    # old prefetch pulled every Requirement row just to count them).
+    setups = Setup.objects.annotate(
+        _num_requirements=Count("requirements"),
+        _num_met=Count("requirements", filter=Q(requirements__status=Requirement.Status.MET)),
+        _num_unmet=Count("requirements", filter=Q(requirements__status=Requirement.Status.UNMET)),
+        _num_partially_met=Count("requirements", filter=Q(requirements__status=Requirement.Status.PARTIALLY_MET)),
+        _num_processing=Count("requirements", filter=Q(requirements__status=Requirement.Status.PROCESSING)),
+        _num_unprocessed=Count("requirements", filter=Q(requirements__status=Requirement.Status.UNPROCESSED)),
+        _num_error=Count("requirements", filter=Q(requirements__status=Requirement.Status.ERROR)),
     )
     results = []
     for s in setups:
@@ -41,20 +326,19 @@ def api_list_setups(request):
             {
                 "id": s.id,
                 "name": s.name,
-                "created_at": timezone.localtime(s.created_at).strftime("%Y-%m-%d %H:%M"),
+                "created_at": _fmt_minutes(s.created_at),
                 "state": s.state or Setup.State.READY,
                 "screenshot": s.screenshot.url if s.screenshot else "",
-                "num_requirements": s.num_requirements,
-                "num_met": s.num_met,
-                "num_unmet": s.num_unmet,
-                "num_partially_met": s.num_partially_met,
-                "num_processing": s.num_processing,
-                "num_unprocessed": s.num_unprocessed,
-                "num_error": s.num_error,
+                "num_requirements": s._num_requirements,
+                "num_met": s._num_met,
+                "num_unmet": s._num_unmet,
+                "num_partially_met": s._num_partially_met,
+                "num_processing": s._num_processing,
+                "num_unprocessed": s._num_unprocessed,
+                "num_error": s._num_error,
                 "tags": list(s.tags_json or []),
             }
         )
-    print("results", results)
     return JsonResponse({"setups": results})
 
 
@@ -67,15 +351,13 @@ def add_setup(request):
     except Exception:
         pass
     default_llm = LLM.MODEL_GPT_4_1
-    valid_llms = [v for (v, _d) in AVAILABLE_MODELS]
     selected_llm = request.POST.get("llm_model") if request.method == "POST" else default_llm
-    if selected_llm not in valid_llms:
+    if selected_llm not in _VALID_LLMS:
         selected_llm = default_llm
 
     # Determine selected Agent (defaults configured) and validate
-    valid_agents = [v for (v, _d) in AVAILABLE_AGENTS]
     selected_agent = request.POST.get("agent_model") if request.method == "POST" else DEFAULT_AGENT
-    if selected_agent not in valid_agents:
+    if selected_agent not in _VALID_AGENTS:
         selected_agent = DEFAULT_AGENT
 
     # Build reasoning steps options (10..120 by 10)
@@ -84,109 +366,37 @@ def add_setup(request):
     if request.method == "POST":
         form = SetupForm(request.POST)
         if form.is_valid():
-            # Save Setup
-            setup = form.save()
-            # Persist selected llm_model explicitly in case of tampering/defaults
-            try:
-                if selected_llm and setup.llm_model != selected_llm:
-                    setup.llm_model = selected_llm
-                    setup.save(update_fields=["llm_model"])
-                if selected_agent and setup.agent_model != selected_agent:
-                    setup.agent_model = selected_agent
-                    setup.save(update_fields=["agent_model"])
-            except Exception:
-                pass
-            # Try to capture a screenshot of the start_url
-            try:
-                print(f"Capturing screenshot for {setup.start_url}")
-                shooter = PlaywrightScreenshotter()
-                img_bytes = shooter.capture_to_bytes(setup.start_url)
-                if img_bytes:
-                    setup.screenshot.save(f"setup_{setup.pk}.png", ContentFile(img_bytes), save=True)
-                # Always run AppExtractor to get description and (optionally) tags
-                try:
-                    try:
-                        set_api_keys_from_settings()
-                    except Exception:
-                        pass
-                    updates = []
-                    extractor = AppExtractor(llm=LLM(model_name=selected_llm, temperature=0.05))
-                    # Use the raw input to help the model infer high-level details
-                    req_text = form.cleaned_data.get("requirements_input", "") or ""
-                    result = extractor.extract_app(
-                        image_bytes=img_bytes,
-                        image_url=None,
-                        requirements=None,
-                        requirements_text=req_text,
-                        max_tags=7,
-                    )
-                    # Always set description when provided by extractor
-                    if result and getattr(result, "description", None):
-                        setup.description = result.description
-                        updates.append("description")
-                    # Determine final tags: user provided or extracted
-                    raw_tags = (form.cleaned_data.get("tags_input") or "").strip()
-                    if raw_tags:
-                        tags = [t.strip() for t in raw_tags.replace(";", ",").split(",") if t.strip()]
-                        setup.tags_json = tags
-                        updates.append("tags_json")
-                    elif result and getattr(result, "tags", None):
-                        setup.tags_json = list(result.tags)
-                        updates.append("tags_json")
-                    if updates:
-                        setup.save(update_fields=updates)
-                except Exception as te:
-                    print(f"Error extracting/applying tags/description: {te}")
-            except Exception as e:
-                print(f"Error capturing screenshot: {e}")
-            # Use RequirementsProcessor to extract structured requirements from textarea
-            req_text = form.cleaned_data.get("requirements_input", "") or ""
-            if req_text.strip():
-                try:
-                    set_api_keys_from_settings()
-                except Exception:
-                    pass
-                processor = RequirementsProcessor(llm=LLM(model_name=selected_llm, temperature=0.05))
-                extracted = processor.process_text(
-                    input_text=req_text,
-                    allow_guess=bool(form.cleaned_data.get("allow_guess")),
-                    default_priority=RequirementsPriority.MEDIUM,
-                    source=setup.start_url,
-                )
-                bulk = [framework_to_model(setup, r) for r in extracted]
-                if bulk:
-                    Requirement.objects.bulk_create(bulk)
-                    # Create related acceptance criteria per requirement
-                    created = list(Requirement.objects.filter(setup=setup, framework_id__in=[b.framework_id for b in bulk]))
-                    fw_map = {str(r.id): r for r in extracted}
-                    for mr in created:
-                        fwr = fw_map.get(str(mr.framework_id))
-                        if fwr:
-                            create_model_criteria_from_framework(mr, fwr)
-            # Persist Inputs mapping if provided
+            # Save Setup in PROCESSING state; the slow work (screenshot,
+            # description/tags extraction, requirement extraction) runs in
+            # extract_and_capture_task so the POST returns immediately. The
+            # overview polls api_list_setups, which surfaces the state.
+            setup = form.save(commit=False)
+            setup.state = Setup.State.PROCESSING
+            # Persist selected models explicitly in case of tampering/defaults
+            if selected_llm:
+                setup.llm_model = selected_llm
+            if selected_agent:
+                setup.agent_model = selected_agent
+            # Attach the Inputs mapping before the save so the whole setup
+            # (state, models, inputs) lands in one INSERT instead of a
+            # follow-up UPDATE per field group
             try:
-                raw_inputs = (request.POST.get("inputs_json") or "").strip()
-                if raw_inputs:
-                    data = json.loads(raw_inputs)
-                    mapping = {}
-                    if isinstance(data, list):
-                        for it in data:
-                            try:
-                                key = str((it.get("key") or "").strip())
-                                val = str(it.get("value") if it.get("value") is not None else "")
-                            except Exception:
-                                continue
-                            if key:
-                                mapping[key] = val
-                    elif isinstance(data, dict):
-                        mapping = {str(k): str(v) for k, v in data.items()}
-                    if mapping:
-                        db_inputs = Inputs.objects.create(mapping_json=mapping)
-                        setup.inputs = db_inputs
-                        setup.save(update_fields=["inputs"])
+                mapping = _parse_inputs_mapping((request.POST.get("inputs_json") or "").strip())
+                if mapping:
+                    setup.inputs = Inputs.objects.create(mapping_json=mapping)
             except Exception as e:
                 # Do not fail on inputs parsing errors
                 print(f"Failed to parse inputs_json: {e}")
+            setup.save()
+            req_text = form.cleaned_data.get("requirements_input", "") or ""
+            raw_tags = (form.cleaned_data.get("tags_input") or "").strip()
+            extract_and_capture_task.delay(
+                setup.id,
+                selected_llm,
+                req_text,
+                bool(form.cleaned_data.get("allow_guess")),
+                raw_tags,
+            )
             return redirect("setups:open", pk=setup.pk)
     else:
         form = SetupForm(initial={"llm_model": selected_llm, "agent_model": selected_agent})
@@ -211,21 +421,7 @@ def edit_setup(request, pk: int):
             obj.save()
             # Persist Inputs mapping if provided
             try:
-                raw_inputs = (request.POST.get("inputs_json") or "").strip()
-                mapping = {}
-                if raw_inputs:
-                    data = json.loads(raw_inputs)
-                    if isinstance(data, list):
-                        for it in data:
-                            try:
-                                key = str((it.get("key") or "").strip())
-                                val = str(it.get("value") if it.get("value") is not None else "")
-                            except Exception:
-                                continue
-                            if key:
-                                mapping[key] = val
-                    elif isinstance(data, dict):
-                        mapping = {str(k): str(v) for k, v in data.items()}
+                mapping = _parse_inputs_mapping((request.POST.get("inputs_json") or "").strip())
                 # Update or create/delete Inputs
                 if mapping:
                     if getattr(obj, "inputs", None):
@@ -269,25 +465,25 @@ def edit_setup(request, pk: int):
 
 
 @require_http_methods(["GET"])
+@condition(etag_func=_requirements_etag)
 def api_requirements(request, pk: int):
     setup = get_object_or_404(Setup, pk=pk)
     q = setup.requirements.all().order_by("created_at")
 
-    results = []
-    for idx, r in enumerate(q, start=1):
-        results.append(
-            {
+    def _records():
+        for idx, r in enumerate(q.iterator(chunk_size=200), start=1):
+            yield {
                 "id": r.id,
                 "index": idx,
                 "title": r.title,
                 "description": r.description,
-                "priority": r.priority,
+                "priority": sys.intern(r.priority),
                 "tags": list(r.tags_json or []),
-                "created_at": timezone.localtime(r.created_at).strftime("%Y-%m-%d"),
-                "status": r.status,
+                "created_at": _fmt_date(r.created_at),
+                "status": sys.intern(r.status),
             }
-        )
-    return JsonResponse({"requirements": results})
+
+    return _stream_json_list("requirements", _records())
 
 
 @require_http_methods(["POST"])
@@ -310,27 +506,37 @@ def api_requirements_add(request, pk: int):
         to_create = [framework_to_model(setup, r) for r in extracted]
         if not to_create:
             return JsonResponse({"created": []})
-        # Keep track of framework IDs to reliably fetch after bulk_create
+        # Keep track of framework IDs to reliably fetch after bulk_create:
+        # MySQL cannot return PKs from bulk inserts, so the client-generated
+        # framework_id is the mapping key. Fetch only the columns the criteria
+        # creation and response payload actually read.
         fw_ids = [obj.framework_id for obj in to_create]
         Requirement.objects.bulk_create(to_create)
-        # Create criteria per requirement
-        created_qs = list(Requirement.objects.filter(setup=setup, framework_id__in=fw_ids).order_by("created_at"))
-        # Build mapping by framework_id string
+        created_qs = list(
+            Requirement.objects.filter(setup=setup, framework_id__in=fw_ids)
+            .only("id", "framework_id", "title", "description", "priority", "tags_json", "created_at", "status")
+            .order_by("created_at")
+        )
+        # Build mapping by framework_id string; criteria for all created
+        # requirements land in one bulk insert instead of one per requirement
         fw_map = {str(fr.id): fr for fr in extracted}
+        all_criteria = []
         for mr in created_qs:
             fw_req = fw_map.get(str(mr.framework_id))
             if fw_req:
-                create_model_criteria_from_framework(mr, fw_req)
+                all_criteria.extend(build_criteria_instances(mr, fw_req))
+        if all_criteria:
+            AcceptanceCriterion.objects.bulk_create(all_criteria, batch_size=500)
         created_payload = []
         for r in created_qs:
             created_payload.append({
                 "id": r.id,
                 "title": r.title,
                 "description": r.description,
-                "priority": r.priority,
+                "priority": sys.intern(r.priority),
                 "tags": list(r.tags_json or []),
-                "created_at": timezone.localtime(r.created_at).strftime("%Y-%m-%d"),
-                "status": r.status,
+                "created_at": _fmt_date(r.created_at),
+                "status": sys.intern(r.status),
             })
         return JsonResponse({"created": created_payload})
 
@@ -345,7 +551,7 @@ def api_requirements_add(request, pk: int):
         setup=setup,
         title=title,
         description=description,
-        priority=priority if priority in dict(Requirement.Priority.choices) else Requirement.Priority.MEDIUM,
+        priority=priority if priority in _VALID_PRIORITIES else Requirement.Priority.MEDIUM,
         tags_json=tags,
         status=Requirement.Status.UNPROCESSED,
     )
@@ -356,7 +562,7 @@ def api_requirements_add(request, pk: int):
             "description": r.description,
             "priority": r.priority,
             "tags": list(r.tags_json or []),
-            "created_at": timezone.localtime(r.created_at).strftime("%Y-%m-%d"),
+            "created_at": _fmt_date(r.created_at),
             "status": r.status,
         }]
     })
@@ -373,9 +579,18 @@ def api_requirements_delete(request, pk: int, req_id: int):
 @require_http_methods(["POST", "DELETE"])
 def api_requirements_delete_all(request, pk: int):
     setup = get_object_or_404(Setup, pk=pk)
-    # Delete all requirements and cascaded runs for this setup
+    # Delete the whole requirement tree with four bulk DELETEs, children
+    # first. The ORM cascade would fetch every PK and instantiate related
+    # rows in memory before deleting; no model in this app registers delete
+    # signals, so the collector buys nothing here.
     with transaction.atomic():
-        Requirement.objects.filter(setup=setup).delete()
+        for qs in (
+            RunInteraction.objects.filter(run__requirement__setup=setup),
+            VerificationRun.objects.filter(requirement__setup=setup),
+            AcceptanceCriterion.objects.filter(requirement__setup=setup),
+            Requirement.objects.filter(setup=setup),
+        ):
+            qs._raw_delete(qs.db)
     return JsonResponse({"ok": True})
 
 
@@ -388,7 +603,7 @@ def api_setup_summary(request, pk: int):
     Sections are separated by an em dash divider.
     """
     setup = get_object_or_404(Setup, pk=pk)
-    requirements = setup.requirements.all().order_by("created_at")
+    requirements = setup.requirements.only("id", "title", "description").order_by("created_at")
     # Optional filter: comma-separated statuses in query param, e.g. ?statuses=unmet,partially_met
     statuses_raw = (request.GET.get("statuses") or "").strip()
     allowed_statuses: set[str] = set()
@@ -399,36 +614,34 @@ def api_setup_summary(request, pk: int):
             allowed_statuses = set()
     parts: list[str] = []
 
-    for r in requirements:
-        latest = (
-            VerificationRun.objects.filter(requirement=r)
-            .order_by("-created_at")
-            .first()
+    # Latest run per requirement in one query: rows arrive newest-first per
+    # requirement, so the first row seen wins (same pattern as
+    # api_requirements_latest_decisions). Avoids one query per requirement.
+    latest_by_req: dict[int, dict] = {}
+    run_rows = (
+        VerificationRun.objects.filter(requirement__setup=setup)
+        .annotate(
+            detailed_txt=Coalesce(
+                *[KeyTextTransform(k, "model_decision_json") for k in _DETAILED_KEYS],
+                Value(""),
+                output_field=TextField(),
+            )
         )
+        .order_by("requirement_id", "-created_at")
+        .values("requirement_id", "status", "detailed_txt")
+    )
+    for row in run_rows:
+        latest_by_req.setdefault(row["requirement_id"], row)
+
+    for r in requirements:
+        latest = latest_by_req.get(r.id)
         if not latest:
             continue
-        try:
-            decision = latest.model_decision_json or {}
-        except Exception:
-            decision = {}
         # Skip if status filter provided and latest run status not in allowed set
-        if allowed_statuses:
-            try:
-                status_raw = latest.status if isinstance(latest.status, str) else str(latest.status)
-            except Exception:
-                status_raw = str(latest.status)
-            if status_raw not in allowed_statuses:
-                continue
-        # Broad support for possible keys
-        detailed = None
-        if isinstance(decision, dict):
-            detailed = (
-                decision.get("detailed_summary")
-                or decision.get("details")
-                or decision.get("summary_detailed")
-                or decision.get("detailed")
-                or decision.get("summary")
-            )
+        status_raw = str(latest["status"] or "")
+        if allowed_statuses and status_raw not in allowed_statuses:
+            continue
+        detailed = latest["detailed_txt"]
         if not detailed:
             continue
 
@@ -439,11 +652,7 @@ def api_setup_summary(request, pk: int):
             req_text = f"Requirement #{r.pk}"
 
         # Normalize status text for display (met, partially_met, unmet, error, processing)
-        try:
-            status_raw = latest.status if isinstance(latest.status, str) else str(latest.status)
-        except Exception:
-            status_raw = str(latest.status)
-        status_disp = (status_raw or "").strip().lower()
+        status_disp = status_raw.strip().lower()
         parts.append(f"{req_text} ({status_disp})\n{detailed}")
 
     combined = ("\n\n---\n\n".join(parts)) if parts else ""
@@ -456,6 +665,7 @@ def api_requirement_summary(request, req_id: int):
     req = get_object_or_404(Requirement, pk=req_id)
     latest = (
         VerificationRun.objects.filter(requirement=req)
+        .only("id", "status", "model_decision_json")
         .order_by("-created_at")
         .first()
     )
@@ -467,13 +677,7 @@ def api_requirement_summary(request, req_id: int):
         decision = {}
     detailed = None
     if isinstance(decision, dict):
-        detailed = (
-            decision.get("detailed_summary")
-            or decision.get("details")
-            or decision.get("summary_detailed")
-            or decision.get("detailed")
-            or decision.get("summary")
-        )
+        detailed = next((decision[k] for k in _DETAILED_KEYS if decision.get(k)), None)
     if not detailed:
         return JsonResponse({"text": "", "count": 0})
 
@@ -529,113 +733,88 @@ def runs_overview(request, req_id: int):
 @require_http_methods(["GET"])
 def api_runs_list(request, req_id: int):
     req = get_object_or_404(Requirement, pk=req_id)
+    # The payload needs one small string out of model_decision_json; extract
+    # it server-side so the potentially large blob never leaves the database
     runs = (
         VerificationRun.objects.filter(requirement=req)
-        .prefetch_related("interactions")
+        .annotate(
+            explanation_txt=Coalesce(
+                KeyTextTransform("explanation", "model_decision_json"),
+                KeyTextTransform("explanation_summary", "model_decision_json"),
+                KeyTextTransform("why", "model_decision_json"),
+                Value(""),
+                output_field=TextField(),
+            ),
+            tokens_in=Cast(KeyTextTransform("tokens_in", "usage_total_json"), IntegerField()),
+            tokens_out=Cast(KeyTextTransform("tokens_out", "usage_total_json"), IntegerField()),
+            # A processing run without an assigned display is shown as waiting
+            status_ui=Case(
+                When(status=VerificationRun.Status.PROCESSING, display_str="", then=Value("waiting_for_display")),
+                When(status=VerificationRun.Status.PROCESSING, display_str__isnull=True, then=Value("waiting_for_display")),
+                default=F("status"),
+                output_field=CharField(),
+            ),
+        )
+        .defer("model_decision_json", "usage_total_json", "display_str")
         .order_by("-created_at")
     )
-    media_root = Path(getattr(settings, "MEDIA_ROOT", "")).resolve() if getattr(settings, "MEDIA_ROOT", None) else None
-    media_url = getattr(settings, "MEDIA_URL", "/media/")
-    if not media_url.endswith("/"):
-        media_url = media_url + "/"
-
-    def _to_media_url(raw_path: str) -> str:
-        if not raw_path:
-            return ""
-        s = str(raw_path)
-        s_norm = s.replace("\\", "/")
-        if s_norm.startswith("http://") or s_norm.startswith("https://"):
-            return s_norm
-        idx = s_norm.find("/media/")
-        if idx != -1:
-            return s_norm[idx:]
-        try:
-            if media_root:
-                rel = Path(s_norm).resolve().relative_to(media_root)
-                return media_url + str(rel).replace("\\", "/")
-        except Exception:
-            pass
-        parts = [p for p in s_norm.split("/") if p]
-        if "media" in parts:
-            m_idx = parts.index("media")
-            tail = "/".join(parts[m_idx+1:])
-            return media_url + tail
-        return s_norm
-    payload = []
-    for r in runs:
-        # Derive UI status: if run is marked processing but no display assigned yet, show waiting state
-        try:
-            status_raw = r.status if isinstance(r.status, str) else str(r.status)
-        except Exception:
-            status_raw = str(r.status)
-        status_ui = status_raw
-        try:
-            if status_raw == VerificationRun.Status.PROCESSING and not r.display_str:
-                status_ui = "waiting_for_display"
-        except Exception:
-            # Fallback compare to string literal
-            if status_raw == "processing" and not r.display_str:
-                status_ui = "waiting_for_display"
-        # Extract token usage from usage_total_json if available
-        usage = r.usage_total_json or {}
-        def _num_or_none(val):
-            try:
-                if val is None:
-                    return None
-                if isinstance(val, (int, float)):
-                    return int(val)
-                return int(str(val).strip())
-            except Exception:
-                return None
-        tokens_in = _num_or_none(usage.get("tokens_in"))
-        tokens_out = _num_or_none(usage.get("tokens_out"))
-        tokens_in_fmt = f"{tokens_in:,}" if tokens_in is not None else None
-        tokens_out_fmt = f"{tokens_out:,}" if tokens_out is not None else None
-        # Extract concise explanation from model decision json, if present
-        try:
-            decision = r.model_decision_json or {}
-        except Exception:
-            decision = {}
-        explanation = (
-            (decision.get("explanation") if isinstance(decision.get("explanation"), str) else None)
-            or (decision.get("explanation_summary") if isinstance(decision.get("explanation_summary"), str) else None)
-            or (decision.get("why") if isinstance(decision.get("why"), str) else None)
-            or ""
-        )
-
-        payload.append(
-            {
+    def _records():
+        for r in runs.iterator(chunk_size=200):
+            # Token counts arrive pre-cast from the annotations; only
+            # formatting remains in Python
+            tokens_in_fmt = f"{r.tokens_in:,}" if r.tokens_in is not None else None
+            tokens_out_fmt = f"{r.tokens_out:,}" if r.tokens_out is not None else None
+            yield {
                 "id": r.id,
-                "status": status_ui,
-                "created_at": timezone.localtime(r.created_at).strftime("%Y-%m-%d %H:%M"),
-                "started_at": timezone.localtime(r.started_at).strftime("%Y-%m-%d %H:%M:%S"),
-                "finished_at": timezone.localtime(r.finished_at).strftime("%Y-%m-%d %H:%M:%S"),
+                "status": r.status_ui,
+                "created_at": _fmt_minutes(r.created_at),
+                "started_at": _fmt_seconds(r.started_at),
+                "finished_at": _fmt_seconds(r.finished_at),
                 "elapsed_s": r.elapsed_s,
                 "steps_taken": r.steps_taken,
                 "start_url": r.start_url,
                 "current_url": r.current_url or "",
                 "error": r.error or "",
                 "last_screenshot_url": _to_media_url(r.last_screenshot or ""),
-                "tokens_in": tokens_in,
-                "tokens_out": tokens_out,
+                "tokens_in": r.tokens_in,
+                "tokens_out": r.tokens_out,
                 "tokens_in_fmt": tokens_in_fmt,
                 "tokens_out_fmt": tokens_out_fmt,
-                "explanation": explanation,
+                "explanation": r.explanation_txt or "",
             }
-        )
-    return JsonResponse({"runs": payload})
+
+    return _stream_json_list("runs", _records())
 
 
 @require_http_methods(["GET"])
 def api_requirement_latest_decision(request, req_id: int):
-    """Return the latest run's model_decision_json for a requirement, or null if none."""
+    """Return the latest run's model_decision_json for a requirement, or null if none.
+
+    Supports long-polling via ?wait=<seconds> (capped at 30s): the response is
+    held back until a decision is available or the wait window elapses, so
+    clients do not need to re-poll every few seconds.
+    """
     req = get_object_or_404(Requirement, pk=req_id)
-    latest = (
-        VerificationRun.objects.filter(requirement=req)
-        .order_by("-created_at")
-        .first()
-    )
-    decision = latest.model_decision_json if latest and latest.model_decision_json else None
+    try:
+        wait_s = min(float(request.GET.get("wait") or 0.0), 30.0)
+    except Exception:
+        wait_s = 0.0
+    poll_deadline = time.monotonic() + wait_s
+    while True:
+        latest = (
+            VerificationRun.objects.filter(requirement=req)
+            .only("id", "status", "model_decision_json")
+            .order_by("-created_at")
+            .first()
+        )
+        decision = latest.model_decision_json if latest and latest.model_decision_json else None
+        if (
+            decision is not None
+            or (latest is not None and latest.status in _TERMINAL_RUN_STATUSES)
+            or time.monotonic() >= poll_deadline
+        ):
+            break
+        time.sleep(1.0)
     status = latest.status if latest else None
     return JsonResponse({
         "requirement_id": req.id,
@@ -644,6 +823,41 @@ def api_requirement_latest_decision(request, req_id: int):
     })
 
 
+@require_http_methods(["GET"])
+def api_requirements_latest_decisions(request):
+    """Return latest decisions for several requirements in one request.
+
+    Query param: ?ids=1,2,3. Response: {"decisions": {"<id>": {status,
+    model_decision_json}}} with one entry per requirement that has runs.
+    """
+    ids_raw = (request.GET.get("ids") or "").strip()
+    ids: list[int] = []
+    for part in ids_raw.split(","):
+        part = part.strip()
+        if part:
+            try:
+                ids.append(int(part))
+            except ValueError:
+                return HttpResponseBadRequest("Invalid ids parameter")
+    if not ids:
+        return JsonResponse({"decisions": {}})
+    decisions: dict[str, dict] = {}
+    runs = (
+        VerificationRun.objects.filter(requirement_id__in=ids)
+        .order_by("requirement_id", "-created_at")
+        .values("requirement_id", "status", "model_decision_json")
+    )
+    # Rows are ordered newest-first per requirement; keep the first seen
+    for row in runs:
+        key = str(row["requirement_id"])
+        if key not in decisions:
+            decisions[key] = {
+                "status": row["status"],
+                "model_decision_json": row["model_decision_json"] or None,
+            }
+    return JsonResponse({"decisions": decisions})
+
+
 @require_http_methods(["POST"])
 def api_runs_start(request, req_id: int):
     req = get_object_or_404(Requirement, pk=req_id)
@@ -656,85 +870,90 @@ def api_runs_start(request, req_id: int):
 @require_http_methods(["POST"])
 def api_runs_start_all(request, pk: int):
     setup = get_object_or_404(Setup, pk=pk)
-    reqs = setup.requirements.all()
-    tasks = []
-    for r in reqs:
-        try:
-            async_result = run_verification_task.delay(r.id)
-            tasks.append({"requirement_id": r.id, "task_id": async_result.id})
-        except Exception:
-            tasks.append({"requirement_id": r.id, "task_id": None, "error": True})
+    # One broker round-trip for the whole fan-out: group() pipelines all
+    # publishes over a single pooled connection, where a .delay() per
+    # requirement paid one synchronous publish each
+    req_ids = list(setup.requirements.values_list("id", flat=True))
+    if not req_ids:
+        return JsonResponse({"started": True, "tasks": []})
+    try:
+        job = group(run_verification_task.s(rid) for rid in req_ids).apply_async()
+        tasks = [
+            {"requirement_id": rid, "task_id": ar.id}
+            for rid, ar in zip(req_ids, job.results or [])
+        ]
+    except Exception:
+        tasks = [{"requirement_id": rid, "task_id": None, "error": True} for rid in req_ids]
     return JsonResponse({"started": True, "tasks": tasks})
 
 
 def run_detail(request, run_id: int):
+    # Prefetch only the interaction columns the loop below reads; the page
+    # can carry hundreds of interactions and the wide text columns we skip
+    # dominate the row size otherwise.
+    interactions_qs = RunInteraction.objects.order_by("turn_index").only(
+        "run_id",
+        "turn_index",
+        "started_at",
+        "finished_at",
+        "elapsed_s",
+        "model_response_id",
+        "reasoning_summary",
+        "message_text",
+        "screenshot_path",
+        "usage_json",
+        "action_type",
+        "action_params_json",
+        "action_call_id",
+        "action_status",
+        "action_safety_checks_json",
+    )
     run = get_object_or_404(
-        VerificationRun.objects.select_related("requirement", "requirement__setup").prefetch_related("interactions"),
+        VerificationRun.objects.select_related("requirement", "requirement__setup").prefetch_related(
+            Prefetch("interactions", queryset=interactions_qs)
+        ),
         pk=run_id,
     )
     requirement = run.requirement
+    # Freshly-started runs polled by the UI have neither a decision nor
+    # interactions yet; render straight away instead of walking the token,
+    # criteria and schema-probing blocks below. The interactions check hits
+    # the prefetch cache, so this costs no extra query.
+    if not run.model_decision_json and not run.interactions.all():
+        return render(request, "setups/run_detail.html", {
+            "run": run,
+            "requirement": requirement,
+            "interactions": [],
+            "tokens_present": False,
+            "tokens_in_fmt": "-",
+            "tokens_out_fmt": "-",
+            "decision": {
+                "status": None,
+                "final_url": None,
+                "explanation": None,
+                "detailed": None,
+                "acceptance": [],
+            },
+        })
     # Build a simple dict for interactions to avoid heavy logic in template
-    media_root = Path(getattr(settings, "MEDIA_ROOT", "")).resolve() if getattr(settings, "MEDIA_ROOT", None) else None
-    media_url = getattr(settings, "MEDIA_URL", "/media/")
-    if not media_url.endswith("/"):
-        media_url = media_url + "/"
-
-    def _to_media_url(raw_path: str) -> str:
-        if not raw_path:
-            return ""
-        s = str(raw_path)
-        s_norm = s.replace("\\", "/")
-        # Already a URL
-        if s_norm.startswith("http://") or s_norm.startswith("https://"):
-            return s_norm
-        # If it already contains /media/, slice from there
-        idx = s_norm.find("/media/")
-        if idx != -1:
-            return s_norm[idx:]
-        # Try MEDIA_ROOT relative mapping
-        try:
-            if media_root:
-                rel = Path(s_norm).resolve().relative_to(media_root)
-                return media_url + str(rel).replace("\\", "/")
-        except Exception:
-            pass
-        # As a fallback, locate 'media' path segment
-        parts = [p for p in s_norm.split("/") if p]
-        if "media" in parts:
-            m_idx = parts.index("media")
-            tail = "/".join(parts[m_idx+1:])
-            return media_url + tail
-        # Last resort: treat as already absolute path under server; return as-is
-        return s_norm
-
-    def _clean_message_text(text: str) -> str:
-        try:
-            if not text:
-                return ""
-            t = str(text).strip()
-            # Hide JSON/code-fenced content
-            if (t.startswith("{") and t.endswith("}")) or "```" in t:
-                return ""
-            # Heuristic: contains typical JSON keys
-            if '"status"' in t and ('{"' in t or '\n{' in t):
-                return ""
-            return t
-        except Exception:
-            return ""
 
     # Helper: safely coerce token counts to int or None
     def _num_or_none(val):
+        # usage_json stores plain ints in practice; return them untouched
+        # before any conversion work (bool is excluded by the exact check)
+        if type(val) is int:
+            return val
         try:
             if val is None:
                 return None
-            if isinstance(val, (int, float)):
+            if isinstance(val, float):
                 return int(val)
             return int(str(val).strip())
         except Exception:
             return None
 
     interactions = []
-    for it in run.interactions.all().order_by("turn_index"):
+    for it in run.interactions.all():
         raw_path = it.screenshot_path or ""
         screenshot_url = _to_media_url(raw_path)
         msg_text = _clean_message_text(it.message_text or "")
@@ -742,31 +961,31 @@ def run_detail(request, run_id: int):
         usage_obj = it.usage_json or {}
         ti_val = _num_or_none(usage_obj.get("tokens_in"))
         to_val = _num_or_none(usage_obj.get("tokens_out"))
-        ti_fmt = f"{ti_val:,}" if ti_val is not None else None
-        to_fmt = f"{to_val:,}" if to_val is not None else None
+        ti_fmt = _fmt_thousands(ti_val) if ti_val is not None else None
+        to_fmt = _fmt_thousands(to_val) if to_val is not None else None
         interactions.append(
-            {
-                "turn_index": it.turn_index,
-                "started_at": timezone.localtime(it.started_at).strftime("%Y-%m-%d %H:%M:%S"),
-                "finished_at": timezone.localtime(it.finished_at).strftime("%Y-%m-%d %H:%M:%S"),
-                "elapsed_s": it.elapsed_s,
-                "model_response_id": it.model_response_id or "",
-                "reasoning_summary": it.reasoning_summary or "",
-                "message_text": msg_text,
-                "screenshot_url": screenshot_url,
-                "usage": it.usage_json or None,
-                "tokens_in": ti_val,
-                "tokens_out": to_val,
-                "tokens_in_fmt": ti_fmt,
-                "tokens_out_fmt": to_fmt,
-                "action": {
-                    "type": it.action_type,
-                    "params": it.action_params_json,
-                    "call_id": it.action_call_id,
-                    "status": it.action_status,
-                    "safety_checks": it.action_safety_checks_json,
-                },
-            }
+            _InteractionRow(
+                turn_index=it.turn_index,
+                started_at=_fmt_seconds(it.started_at),
+                finished_at=_fmt_seconds(it.finished_at),
+                elapsed_s=it.elapsed_s,
+                model_response_id=it.model_response_id or "",
+                reasoning_summary=it.reasoning_summary or "",
+                message_text=msg_text,
+                screenshot_url=screenshot_url,
+                usage=it.usage_json or None,
+                tokens_in=ti_val,
+                tokens_out=to_val,
+                tokens_in_fmt=ti_fmt,
+                tokens_out_fmt=to_fmt,
+                action=_ActionInfo(
+                    type=sys.intern(it.action_type) if it.action_type else it.action_type,
+                    params=it.action_params_json,
+                    call_id=it.action_call_id,
+                    status=it.action_status,
+                    safety_checks=it.action_safety_checks_json,
+                ),
+            )
         )
     # Compute formatted token usage (American thousands separator) for header
 
@@ -774,8 +993,8 @@ def run_detail(request, run_id: int):
     tokens_in_val = _num_or_none(usage.get("tokens_in"))
     tokens_out_val = _num_or_none(usage.get("tokens_out"))
     tokens_present = (tokens_in_val is not None) or (tokens_out_val is not None)
-    tokens_in_fmt = f"{tokens_in_val:,}" if tokens_in_val is not None else "-"
-    tokens_out_fmt = f"{tokens_out_val:,}" if tokens_out_val is not None else "-"
+    tokens_in_fmt = _fmt_thousands(tokens_in_val) if tokens_in_val is not None else "-"
+    tokens_out_fmt = _fmt_thousands(tokens_out_val) if tokens_out_val is not None else "-"
 
     context = {
         "run": run,
@@ -795,45 +1014,44 @@ def run_detail(request, run_id: int):
         "detailed": decision.get("detailed_summary") or decision.get("details") or decision.get("summary_detailed"),
         "acceptance": [],
     }
-    # Map criterion_name -> stored text for richer display
-    name_to_text = {}
+    # Map criterion_name -> stored text for richer display. Cached across
+    # polls of the same run: criterion name/text rows are immutable once
+    # created, so the criteria count versions the key (Requirement has no
+    # updated_at column to key on) and a hit costs one COUNT instead of
+    # fetching and re-mapping every row.
     try:
-        for c in requirement.criteria.all():
-            n = (getattr(c, "name", "") or "").strip().upper()
-            if n:
-                name_to_text[n] = getattr(c, "text", "") or ""
+        n_criteria = requirement.criteria.count()
+        name_to_text = cache.get_or_set(
+            f"n2t:{requirement.pk}:{n_criteria}",
+            lambda: {
+                n: (c.text or "")
+                for c in requirement.criteria.only("name", "text")
+                if (n := (c.name or "").strip().upper())
+            },
+            300,
+        )
     except Exception:
-        pass
+        name_to_text = {}
     # Broadly support different schema variants for acceptance results
-    ac = (
-        decision.get("acceptance_criteria")
-        or decision.get("acceptance")
-        or decision.get("acceptanceCriteria")
-        or decision.get("criteria_results")
-        or decision.get("acceptance_results")
-        or decision.get("acceptance_criteria_results")
-        or decision.get("criteria")
-        or decision.get("results")
-        or []
-    )
+    ac = next((v for k in _AC_KEYS if (v := decision.get(k))), [])
     if isinstance(ac, dict) and "items" in ac and isinstance(ac["items"], list):
         ac = ac["items"]
     if isinstance(ac, list):
         for item in ac:
             if isinstance(item, dict):
-                nm = item.get("criterion_name") or item.get("name")
-                txt = item.get("criteria") or item.get("criterion") or item.get("text") or item.get("description")
+                nm = _first(item, _NAME_KEYS)
+                txt = _first(item, _TXT_KEYS)
                 if nm and not txt:
                     txt = name_to_text.get(str(nm).strip().upper()) or ""
                 display = (f"{nm}: {txt}" if nm and txt else (txt or nm or ""))
                 met_val = item.get("met") if isinstance(item.get("met"), bool) else None
                 if met_val is None:
-                    met_val = str(item.get("status", "")).strip().lower() in ["met", "pass", "true", "yes"]
+                    met_val = str(item.get("status", "")).strip().lower() in _MET_TRUTHY
                 ui_summary["acceptance"].append({
                     "criteria": display,
                     "met": met_val,
-                    "explanation": item.get("explanation") or item.get("why") or item.get("notes") or item.get("reason") or "",
-                    "evidence": item.get("evidence") or item.get("evidence_text") or item.get("proof") or "",
+                    "explanation": _first(item, _EXPL_KEYS),
+                    "evidence": _first(item, _EVID_KEYS),
                 })
             elif isinstance(item, str):
                 ui_summary["acceptance"].append({"criteria": item, "met": None, "explanation": "", "evidence": ""})
@@ -841,29 +1059,29 @@ def run_detail(request, run_id: int):
         for key, val in ac.items():
             ui_summary["acceptance"].append({
                 "criteria": key,
-                "met": bool(val) if isinstance(val, (bool, int)) else (str(val).lower() in ["met", "pass", "true", "yes"]),
+                "met": bool(val) if isinstance(val, (bool, int)) else (str(val).lower() in _MET_TRUTHY),
                 "explanation": "",
                 "evidence": "",
             })
-    # Fallback to requirement's acceptance criteria if none parsed
+    # Fallback to requirement's acceptance criteria if none parsed; this
+    # path only runs for decisions without usable acceptance data, so the
+    # criteria fetch stays out of the common case
     if not ui_summary["acceptance"]:
-        try:
-            for crit in requirement.criteria.all():
-                ui_summary["acceptance"].append({
-                    "criteria": f"{crit.name}: {crit.text}" if crit.name else crit.text,
-                    "met": None,
-                    "explanation": "",
-                    "evidence": "",
-                })
-        except Exception:
-            pass
+        for crit in requirement.criteria.only("name", "text"):
+            ui_summary["acceptance"].append({
+                "criteria": f"{crit.name}: {crit.text}" if crit.name else crit.text,
+                "met": None,
+                "explanation": "",
+                "evidence": "",
+            })
     context["decision"] = ui_summary
     return render(request, "setups/run_detail.html", context)
 
 
 @require_http_methods(["POST", "DELETE"])
 def api_setup_delete(request, pk: int):
-    setup = get_object_or_404(Setup, pk=pk)
+    # delete() only needs the pk; skip hydrating the wide Setup columns
+    setup = get_object_or_404(Setup.objects.only("id"), pk=pk)
     # Cascades via on_delete=models.CASCADE on related FKs
     setup.delete()
     return JsonResponse({"ok": True})
@@ -878,17 +1096,30 @@ def api_setup_delete(request, pk: int):
 def api_setup_next_unprocessed(request, pk: int):
     """Return the earliest unprocessed requirement for a setup with full details.
 
+    With ?claim=1 the row is atomically marked PROCESSING inside the same
+    transaction (SELECT ... FOR UPDATE SKIP LOCKED), so concurrent workers
+    each claim a different requirement instead of duplicating expensive runs.
     If none exists, returns {"requirement": null}.
     """
     try:
-        setup = Setup.objects.get(pk=pk)
+        # Only id/name end up in the payload; skip the other Setup columns
+        setup = Setup.objects.only("id", "name").get(pk=pk)
     except Setup.DoesNotExist:
         return JsonResponse({})
-    r = (
+    claim = str(request.GET.get("claim", "")).lower() in ("1", "true", "yes")
+    base = (
         Requirement.objects.filter(setup=setup, status=Requirement.Status.UNPROCESSED)
         .order_by("created_at")
-        .first()
+        .only(*_UNPROCESSED_REQ_COLUMNS)
     )
+    if claim:
+        with transaction.atomic():
+            r = base.select_for_update(skip_locked=True).first()
+            if r:
+                r.status = Requirement.Status.PROCESSING
+                r.save(update_fields=["status"])
+    else:
+        r = base.first()
     if not r:
         return JsonResponse({})
     payload = {
@@ -898,15 +1129,17 @@ def api_setup_next_unprocessed(request, pk: int):
         "setup_name": setup.name,
         "title": r.title,
         "description": r.description,
-        "priority": r.priority,
-        "tags": list(r.tags_json or []),
+        "priority": sys.intern(r.priority),
+        # JSONField already yields a fresh list per row; copying it again
+        # just doubled the allocation
+        "tags": r.tags_json if isinstance(r.tags_json, list) else [],
         "acceptance_criteria": [
-            {"name": c.name, "text": c.text, "state": c.state}
-            for c in r.criteria.all()
+            {"name": sys.intern(c.name), "text": c.text, "state": sys.intern(c.state)}
+            for c in r.criteria.only("name", "text", "state")
         ],
         "metadata": r.metadata_json or None,
-        "status": r.status,
-        "created_at": timezone.localtime(r.created_at).strftime("%Y-%m-%d %H:%M"),
+        "status": sys.intern(r.status),
+        "created_at": _fmt_minutes(r.created_at),
     }
     return JsonResponse({"requirement": payload})
 
@@ -914,28 +1147,41 @@ def api_setup_next_unprocessed(request, pk: int):
 @require_http_methods(["GET"])
 def api_requirements_unprocessed_in_setup(request, pk: int):
     """Return all unprocessed requirements for a specific setup with full details."""
-    setup = get_object_or_404(Setup, pk=pk)
-    q = Requirement.objects.filter(setup=setup, status=Requirement.Status.UNPROCESSED).order_by("created_at")
-    items = []
-    for r in q:
-        items.append({
-            "id": r.id,
-            "framework_id": str(r.framework_id),
-            "setup_id": setup.id,
-            "setup_name": setup.name,
-            "title": r.title,
-            "description": r.description,
-            "priority": r.priority,
-            "tags": list(r.tags_json or []),
-            "acceptance_criteria": [
-                {"name": c.name, "text": c.text, "state": c.state}
-                for c in r.criteria.all()
-            ],
-            "metadata": r.metadata_json or None,
-            "status": r.status,
-            "created_at": timezone.localtime(r.created_at).strftime("%Y-%m-%d %H:%M"),
-        })
-    return JsonResponse({"requirements": items})
+    setup = get_object_or_404(Setup.objects.only("id", "name"), pk=pk)
+    q = (
+        Requirement.objects.filter(setup=setup, status=Requirement.Status.UNPROCESSED)
+        .order_by("created_at")
+        .only(*_UNPROCESSED_REQ_COLUMNS)
+        .prefetch_related(
+            Prefetch(
+                "criteria",
+                queryset=AcceptanceCriterion.objects.only("requirement_id", "name", "text", "state"),
+            )
+        )
+    )
+    # Stream one requirement at a time; iterator() caps how many rows are
+    # hydrated at once and the criteria prefetch runs per chunk
+    def _records():
+        for r in q.iterator(chunk_size=200):
+            yield {
+                "id": r.id,
+                "framework_id": str(r.framework_id),
+                "setup_id": setup.id,
+                "setup_name": setup.name,
+                "title": r.title,
+                "description": r.description,
+                "priority": sys.intern(r.priority),
+                "tags": r.tags_json if isinstance(r.tags_json, list) else [],
+                "acceptance_criteria": [
+                    {"name": sys.intern(c.name), "text": c.text, "state": sys.intern(c.state)}
+                    for c in r.criteria.all()
+                ],
+                "metadata": r.metadata_json or None,
+                "status": sys.intern(r.status),
+                "created_at": _fmt_minutes(r.created_at),
+            }
+
+    return _stream_json_list("requirements", _records())
 
 
 @csrf_exempt
@@ -945,19 +1191,16 @@ def api_verification_start_single(request, pk: int, req_id: int):
 
     Returns a minimal payload focusing on model_decision_json (null when processing).
     """
-    try:
-        setup = Setup.objects.get(pk=pk)
-    except Setup.DoesNotExist:
+    # Existence checks only; neither row's columns are needed here
+    if not Setup.objects.filter(pk=pk).exists():
         return JsonResponse({})
-    try:
-        req = Requirement.objects.get(pk=req_id, setup=setup)
-    except Requirement.DoesNotExist:
+    if not Requirement.objects.filter(pk=req_id, setup_id=pk).exists():
         return JsonResponse({})
-    async_result = run_verification_task.delay(req.id)
+    async_result = run_verification_task.delay(req_id)
     return JsonResponse({
         "started": True,
         "task_id": async_result.id,
-        "requirement_id": req.id,
+        "requirement_id": req_id,
         "model_decision_json": None,
         "status": "processing",
     })
@@ -972,7 +1215,7 @@ def api_verification_start_batch(request):
     Returns items with task ids and model_decision_json set to null (will be available after completion via runs APIs).
     """
     try:
-        body = json.loads(request.body.decode("utf-8")) if request.body else {}
+        body = _json_loads(request.body) if request.body else {}
     except Exception:
         body = {}
     ids = body.get("requirement_ids")
@@ -983,24 +1226,46 @@ def api_verification_start_batch(request):
         setup_id_int = int(setup_id)
     except Exception:
         return HttpResponseBadRequest("Missing or invalid setup_id")
-    # Ensure setup exists
-    setup = get_object_or_404(Setup, pk=setup_id_int)
-    items = []
+    # Ensure setup exists; only the pk is used below
+    setup = get_object_or_404(Setup.objects.only("id"), pk=setup_id_int)
+    wanted = []
     for rid in ids:
         try:
-            req = Requirement.objects.get(pk=int(rid), setup=setup)
-            async_result = run_verification_task.delay(req.id)
-            items.append({
-                "requirement_id": req.id,
-                "setup_id": req.setup_id,
-                "task_id": async_result.id,
-                "model_decision_json": None,
-                "status": "processing",
-            })
+            wanted.append(int(rid))
+        except Exception:
+            wanted.append(None)
+    # One membership query for the whole batch; ids that are not integers,
+    # unknown, or belong to another setup fall out as error items below
+    valid_set = set(
+        Requirement.objects.filter(
+            pk__in=[w for w in wanted if w is not None], setup=setup
+        ).values_list("pk", flat=True)
+    )
+    resolved = [w if w in valid_set else None for w in wanted]
+    # One broker round-trip for the whole batch instead of one synchronous
+    # publish per requirement (same pattern as api_runs_start_all)
+    valid_ids = [r for r in resolved if r is not None]
+    task_ids = {}
+    if valid_ids:
+        try:
+            job = group(run_verification_task.s(rid) for rid in valid_ids).apply_async()
+            task_ids = {rid: ar.id for rid, ar in zip(valid_ids, job.results or [])}
         except Exception:
+            pass
+    items = []
+    for rid, resolved_id in zip(ids, resolved):
+        if resolved_id is None:
             items.append({
                 "requirement_id": rid,
                 "error": True,
                 "reason": "not_found_or_setup_mismatch",
             })
+        else:
+            items.append({
+                "requirement_id": resolved_id,
+                "setup_id": setup.pk,
+                "task_id": task_ids.get(resolved_id),
+                "model_decision_json": None,
+                "status": "processing",
+            })
     return JsonResponse({"started": True, "items": items})
\ No newline at end of file
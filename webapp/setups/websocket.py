@@ -2,8 +2,27 @@ from __future__ import annotations
 
 from channels.generic.websocket import AsyncJsonWebsocketConsumer
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements
+    orjson = None
 
-class RunsConsumer(AsyncJsonWebsocketConsumer):
+
+class _OrjsonConsumer(AsyncJsonWebsocketConsumer):
+    """Base consumer that serializes outbound JSON with orjson.
+
+    send_json otherwise runs stdlib json.dumps per frame, which is the hot
+    path for interaction-by-interaction run_progress pushes.
+    """
+
+    @classmethod
+    async def encode_json(cls, content):
+        if orjson is not None:
+            return orjson.dumps(content).decode()
+        return await super().encode_json(content)
+
+
+class RunsConsumer(_OrjsonConsumer):
     async def connect(self):
         try:
             req_id = self.scope['url_route']['kwargs']['req_id']
@@ -23,12 +42,17 @@ class RunsConsumer(AsyncJsonWebsocketConsumer):
         pass
 
     async def run_progress(self, event):
-        payload = event.get('payload', {})
-        await self.send_json(payload)
+        # The producer pre-encodes the payload once for the whole group;
+        # fall back to send_json for senders that still pass the raw dict
+        text = event.get('payload_text')
+        if text is not None:
+            await self.send(text_data=text)
+            return
+        await self.send_json(event.get('payload', {}))
 
 
 
-class SetupsConsumer(AsyncJsonWebsocketConsumer):
+class SetupsConsumer(_OrjsonConsumer):
     async def connect(self):
         # Single shared group for setup-level updates
         self.group_name = "setups"
@@ -44,5 +68,8 @@ class SetupsConsumer(AsyncJsonWebsocketConsumer):
         pass
 
     async def setup_update(self, event):
-        payload = event.get('payload', {})
-        await self.send_json(payload)
+        text = event.get('payload_text')
+        if text is not None:
+            await self.send(text_data=text)
+            return
+        await self.send_json(event.get('payload', {}))